@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The tools are standalone scripts rather than a package; import them from tools/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
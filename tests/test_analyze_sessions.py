@@ -0,0 +1,257 @@
+"""Equivalence checks for the fast paths in tools/analyze_sessions.py.
+
+The fused PatternDetector and the raw-bytes scan behind LazyMessage must
+give exactly the answers of the plain code they replaced; each test compares
+against that reference.
+"""
+
+import json
+import os
+import random
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+import analyze_sessions
+from analyze_sessions import (
+    ERROR_MARKERS,
+    JSON_BACKENDS,
+    SCAN_CHUNK_BYTES,
+    PatternDetector,
+    SessionAnalyzer,
+    SessionCache,
+    SessionFilter,
+    check_columnar_output,
+    get_decoder,
+    scan_raw_string,
+)
+
+ERROR_NEEDLES = ERROR_MARKERS
+
+USER_PROMPTS = [
+    "Please use zen-architect agent to design this",
+    "Can you FIX the failing import?",
+    "Refine the wording, then adjust the layout",
+    "Looks good, ship it",
+    "use the bug-hunter agent",
+    "What does this module do?",
+    "the prefixed fixture needs a refix",  # keywords inside longer words still count
+]
+TOOLS = ["read_file", "glob", "grep", "bash", "web_search", "write_file", "edit_file", "python_check", "task_agent"]
+ARGUMENTS = [
+    {"path": "src/app.py"},
+    {"command": "pytest tests/ -q"},
+    {"command": "make Review"},
+    {"pattern": "TODO"},
+]
+# Raw JSON string literals for tool results, including escapes that spell (or
+# only look like) part of an error marker
+TOOL_RESULTS = [
+    '"ok"',
+    '"Build FAILED after 3 steps"',
+    '"Traceback: KeyError: \'x\'"',
+    '"\\u0045rror: disk full"',
+    '"\\u0065rror"',
+    '"\\failed"',
+    '"caf\\u00e9 \\u2713 done"',
+    '"café ✓ ERROR"',
+    '"line one\\nline two"',
+    '["error", "in", "a", "list"]',
+    '{"status": "failed"}',
+    '"' + "x" * (SCAN_CHUNK_BYTES - 3) + 'error"',
+    '"' + "x" * (SCAN_CHUNK_BYTES - 1) + '\\u0046ailed"',
+]
+
+
+def transcript_lines(rng: random.Random, length: int) -> list[str]:
+    """A synthetic transcript as raw JSONL lines."""
+    lines = []
+    for i in range(length):
+        roll = rng.random()
+        if roll < 0.3:
+            line = json.dumps({"role": "user", "content": rng.choice(USER_PROMPTS)})
+        elif roll < 0.65:
+            calls = [
+                {"id": f"call_{i}_{n}", "tool": rng.choice(TOOLS), "arguments": rng.choice(ARGUMENTS)}
+                for n in range(rng.randint(0, 3))
+            ]
+            content = rng.choice([
+                "Working on it.",
+                [{"type": "thinking", "thinking": "Plan first."}, {"type": "text", "text": "Done."}],
+                [{"type": "tool_call", "name": "bash"}],
+            ])
+            line = json.dumps({"role": "assistant", "content": content, "tool_calls": calls})
+        else:
+            line = f'{{"role": "tool", "content": {rng.choice(TOOL_RESULTS)}}}'
+        lines.append(line)
+    return lines
+
+
+@pytest.fixture(scope="module")
+def projects_dir(tmp_path_factory) -> Path:
+    root = tmp_path_factory.mktemp("projects")
+    rng = random.Random(1234)
+    for n in range(30):
+        session = root / f"proj{n % 3}" / "sessions" / f"{n:04d}abcd"
+        session.mkdir(parents=True)
+        (session / "metadata.json").write_text(json.dumps({"session_id": f"s{n}", "turn_count": n}))
+        lines = transcript_lines(rng, rng.randint(1, 40))
+        (session / "transcript.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return root
+
+
+def available_backends() -> list[str]:
+    backends = []
+    for backend in JSON_BACKENDS[1:]:
+        try:
+            get_decoder(backend)
+        except ValueError:
+            continue
+        backends.append(backend)
+    return backends
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_fused_detector_matches_separate_detectors(projects_dir, backend):
+    analyzer = SessionAnalyzer(str(projects_dir), json_backend=backend)
+    assert analyzer.verify_pattern_detector() == []
+
+    # The corpus has to exercise every detector for the comparison to mean anything
+    totals = PatternDetector()
+    for metadata_path in analyzer.find_all_sessions():
+        for msg in analyzer.iter_transcript(metadata_path.parent):
+            totals.feed(msg)
+    results = totals.results()
+    assert results["delegation"]["agents_used"]
+    assert results["iteration"]["iteration_count"]
+    assert results["exploration"]["parallel_searches"]
+    assert results["implementation"]["total_file_ops"]
+    assert results["error_recovery"]["recovery_attempts"]
+    assert results["planning_execution"]["execution_messages"]
+    assert results["validation"]["test_runs"] and results["validation"]["reviews"]
+
+
+# Sessions carry no "created", so the window falls back to directory mtimes and admits them all
+WIDE_WINDOW = SessionFilter(since=datetime(2000, 1, 1), until=datetime(2100, 1, 1))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_filtered_run_matches_unfiltered(projects_dir, workers):
+    analyzer = SessionAnalyzer(str(projects_dir))
+    expected = analyzer.analyze_all_sessions()
+    assert analyzer.analyze_all_sessions(workers=workers, session_filter=WIDE_WINDOW) == expected
+
+
+def test_filtered_run_reads_metadata_once(projects_dir, monkeypatch):
+    analyzer = SessionAnalyzer(str(projects_dir))
+    reads = []
+    monkeypatch.setattr(analyzer, "parse_metadata", reads.append)
+    assert analyzer.analyze_all_sessions(session_filter=WIDE_WINDOW)
+    assert reads == []
+
+
+def test_discovery_skips_sessions_removed_mid_scan(projects_dir, monkeypatch):
+    scan_dirs = analyze_sessions.scan_dirs
+
+    class Vanished:
+        name = "0999gone"
+        path = str(projects_dir / "proj0" / "sessions" / name)
+
+        def stat(self):
+            raise FileNotFoundError(self.path)
+
+    def racing_scan_dirs(path):
+        yield from scan_dirs(path)
+        if Path(path).name == "sessions":
+            yield Vanished()
+
+    monkeypatch.setattr(analyze_sessions, "scan_dirs", racing_scan_dirs)
+    assert len(SessionAnalyzer(str(projects_dir)).find_all_sessions(WIDE_WINDOW)) == 30
+
+
+def test_cache_survives_relative_projects_dir(projects_dir, tmp_path, monkeypatch):
+    cache_path = tmp_path / "cache.sqlite"
+    for cwd in (projects_dir.parent, tmp_path):
+        monkeypatch.chdir(cwd)
+        cache = SessionCache(cache_path)
+        analyzer = SessionAnalyzer(os.path.relpath(projects_dir))
+        analyzer.analyze_all_sessions(cache=cache)
+        cache.close()
+    assert analyzer.last_run_stats["cached"] == analyzer.last_run_stats["sessions"] == 30
+
+
+def test_fused_detector_matches_on_plain_dicts():
+    rng = random.Random(99)
+    analyzer = SessionAnalyzer("/nonexistent")
+    for _ in range(50):
+        messages = [json.loads(line) for line in transcript_lines(rng, rng.randint(0, 30))]
+        detector = PatternDetector()
+        for msg in messages:
+            detector.feed(msg)
+        assert detector.results() == analyzer.detect_patterns_separately(messages)
+
+
+def decoded_mentions(raw: str, needles) -> bool:
+    """What scan_raw_string must agree with: the decoded, lowercased string."""
+    text = json.loads(raw).lower()
+    return any(needle in text for needle in needles)
+
+
+def scan(raw: str, needles=ERROR_NEEDLES):
+    return scan_raw_string(memoryview(raw.encode("utf-8")), needles)
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ('"all good"', False),
+        ('"Build FAILED"', True),
+        ('"line\\nerror"', True),  # \n is not a letter escape, so the e is literal
+        ('"\\ferror"', True),  # \f escapes the f; "error" after it is literal
+        ('"\\failed"', None),  # the f of failed is the escape: decoded text has no "failed"
+        ('"\\u0045rror"', None),  # \u0045 spells E
+        ('"\\u0065rror"', None),
+        ('"x\\u0041y"', None),  # a letter escape might complete a needle, so decode to be sure
+        ('"caf\\u00e9 \\u2713"', False),  # non-letter escapes can't spell a needle
+        ('"café ✓ ÉRROR"', False),
+        ('"✓ error ✓"', True),
+        ('"\\\\error"', None),  # an escaped backslash still reads as "escape before the e"
+    ],
+)
+def test_scan_raw_string_escapes_and_unicode(raw, expected):
+    assert scan(raw) is expected
+    if expected is not None:
+        assert expected == decoded_mentions(raw, ERROR_NEEDLES)
+
+
+@pytest.mark.parametrize("offset", range(-8, 3))
+def test_scan_raw_string_match_spanning_chunks(offset):
+    # Place "error" so it starts anywhere from well before to just after the first chunk boundary
+    raw = '"' + "x" * (SCAN_CHUNK_BYTES + offset - 1) + "error" + "y" * SCAN_CHUNK_BYTES + '"'
+    assert scan(raw) is True
+
+
+@pytest.mark.parametrize("offset", range(-8, 3))
+def test_scan_raw_string_escape_spanning_chunks(offset):
+    raw = '"' + "x" * (SCAN_CHUNK_BYTES + offset - 1) + "\\u0045rror" + '"'
+    assert scan(raw) is None
+    raw = '"' + "x" * (SCAN_CHUNK_BYTES + offset - 1) + "\\u00e9rror" + '"'
+    assert scan(raw) is decoded_mentions(raw, ERROR_NEEDLES) is False
+
+
+def test_scan_raw_string_agrees_with_decoding():
+    rng = random.Random(7)
+    pieces = ["x", "E", "r", "o", "fai", "ailed", "\\n", "\\\\", "\\u0045", "\\u00e9", "é", " "]
+    for _ in range(2000):
+        raw = '"' + "".join(rng.choice(pieces) for _ in range(rng.randint(0, 20))) + '"'
+        found = scan(raw)
+        assert found is None or found == decoded_mentions(raw, ERROR_NEEDLES), raw
+
+
+def test_columnar_output_is_checked_up_front(monkeypatch):
+    with pytest.raises(ValueError, match="Unsupported columnar format"):
+        check_columnar_output("sessions.csv")
+    monkeypatch.setattr(analyze_sessions.importlib.util, "find_spec", lambda name: None)
+    with pytest.raises(ImportError, match="needs pyarrow"):
+        check_columnar_output("sessions.parquet")
@@ -0,0 +1,98 @@
+"""Layout checks for tools/html2pptx.py: nothing may end below the slide."""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pptx")
+pytest.importorskip("bs4")
+
+from pptx.enum.shapes import MSO_SHAPE_TYPE  # noqa: E402
+from pptx.util import Emu, Inches  # noqa: E402
+
+from html2pptx import MIN_CARD_WIDTH, HTMLToPPTXConverter  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DECKS = sorted((REPO_ROOT / "docs").glob("*.html"))
+
+
+def convert(html: str):
+    return HTMLToPPTXConverter(html).convert()
+
+
+def overflowing_shapes(prs) -> list[tuple[int, str, float]]:
+    """(slide number, shape name, bottom in inches) for shapes ending past the slide."""
+    return [
+        (slide_num, shape.name, round(Emu(shape.top + shape.height).inches, 2))
+        for slide_num, slide in enumerate(prs.slides, 1)
+        for shape in slide.shapes
+        if shape.top + shape.height > prs.slide_height
+    ]
+
+
+def overlapping_shapes(prs) -> list[tuple[int, str, str]]:
+    """(slide number, shape, shape) for shapes that partly cover each other.
+
+    A shape lying wholly inside another (text on its card, a tenet's accent
+    bar) is how blocks are built, so only partial overlaps count.
+    """
+    tolerance = Inches(0.02)
+
+    def bounds(shape):
+        return shape.left, shape.top, shape.left + shape.width, shape.top + shape.height
+
+    def contains(outer, inner):
+        return all(outer[i] <= inner[i] + tolerance for i in (0, 1)) and all(
+            outer[i] >= inner[i] - tolerance for i in (2, 3)
+        )
+
+    found = []
+    for slide_num, slide in enumerate(prs.slides, 1):
+        shapes = [(shape.name, bounds(shape)) for shape in slide.shapes]
+        for i, (name_a, a) in enumerate(shapes):
+            for name_b, b in shapes[i + 1:]:
+                overlap_x = min(a[2], b[2]) - max(a[0], b[0])
+                overlap_y = min(a[3], b[3]) - max(a[1], b[1])
+                if overlap_x > tolerance and overlap_y > tolerance and not (contains(a, b) or contains(b, a)):
+                    found.append((slide_num, name_a, name_b))
+    return found
+
+
+@pytest.mark.parametrize("deck", DECKS, ids=lambda path: path.stem)
+def test_docs_deck_stays_on_slide(deck):
+    prs = convert(deck.read_text(encoding="utf-8"))
+    assert overflowing_shapes(prs) == []
+    assert overlapping_shapes(prs) == []
+
+
+def test_many_cards_wrap_into_rows():
+    cards = "".join(
+        f'<div class="card"><div class="card-title">Card {i}</div><div class="card-text">Does thing {i}</div></div>'
+        for i in range(11)
+    )
+    prs = convert(f'<div class="slide"><div class="fourths">{cards}</div></div>')
+    backgrounds = [shape for shape in prs.slides[0].shapes if shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE]
+    assert len(backgrounds) == 11
+    assert min(Emu(shape.width).inches for shape in backgrounds) >= MIN_CARD_WIDTH
+    assert len({shape.top for shape in backgrounds}) > 1
+    assert overflowing_shapes(prs) == []
+
+
+def test_long_content_is_shrunk_onto_slide():
+    items = "".join(f"<li>Feature number {i} with a fairly long description that wraps</li>" for i in range(40))
+    prs = convert(f'<div class="slide"><h1>Everything</h1><ul class="feature-list">{items}</ul></div>')
+    assert overflowing_shapes(prs) == []
+
+
+def test_callout_and_small_text_stack_below_content():
+    subhead = "A subhead long enough to wrap onto several lines of the slide. " * 3
+    cards = "".join(
+        f'<div class="card"><div class="card-title">Card {i}</div><div class="card-text">{"Detail. " * 30}</div></div>'
+        for i in range(2)
+    )
+    prs = convert(
+        f'<div class="slide"><h1>Title</h1><p class="subhead">{subhead}</p><div class="halves">{cards}</div>'
+        '<div class="highlight-box">The callout</div><p class="small-text">January 2026</p></div>'
+    )
+    assert overflowing_shapes(prs) == []
+    assert overlapping_shapes(prs) == []
@@ -3,55 +3,801 @@
 Analyze Amplifier sessions to identify problem-solving approaches and patterns.
 """
 
+import argparse
+import importlib.util
 import json
 import os
-from pathlib import Path
-from datetime import datetime
-from collections import defaultdict, Counter
-from typing import Dict, List, Any
 import re
+import sqlite3
+import time
+from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Bump whenever detector, categorization or result-shape logic changes so
+# cached results from older versions are re-analyzed.
+ANALYZER_VERSION = "1"
+CACHE_NAME = ".session-analysis-cache.sqlite"
+# Fresh results are written to the cache in batches of this many sessions
+CACHE_STORE_BATCH = 500
+# Cached results are looked up this many paths per query (SQLite caps bound parameters)
+CACHE_LOOKUP_BATCH = 500
+
+REFINEMENT_KEYWORDS = [
+    "refine",
+    "improve",
+    "fix",
+    "update",
+    "revise",
+    "modify",
+    "adjust",
+    "correct",
+]
+# Substrings that mark a tool result as an error for detect_error_recovery
+ERROR_MARKERS = ("error", "failed")
+EXPLORATION_TOOLS = ["read_file", "glob", "grep", "bash", "web_search"]
+AGENT_NAME_PATTERN = re.compile(r"use\s+(\S+)", re.IGNORECASE)
+
+# Transcript fields the pattern detectors read; everything else (usage, ids,
+# provider metadata, ...) can be skipped by backends that decode selectively.
+MESSAGE_FIELDS = ("role", "content", "tool_calls", "timestamp")
+JSON_BACKENDS = ("auto", "msgspec", "orjson", "json")
+
+# Raw content is scanned in chunks of this many bytes, so checking a multi-MB
+# tool result never builds a full-size string or lowercased copy
+SCAN_CHUNK_BYTES = 64 * 1024
+# A letter belongs to a \uXXXX escape only if the "\u" starts at most this many bytes before it
+ESCAPE_LOOKBEHIND = 5
+# \u0041-\u007A spell ASCII letters; other escapes (\u00e9, \u2713, \n, ...) cannot
+LETTER_ESCAPE_DIGITS = (b"4", b"5", b"6", b"7")
+
+
+def scan_raw_string(raw: memoryview, needles: Iterable[str]) -> Optional[bool]:
+    """Case-insensitively search a raw JSON string literal for any of needles.
+
+    Returns True/False when the undecoded bytes answer the question exactly as
+    `any(n in json.loads(raw).lower() for n in needles)` would, or None when an
+    escape sequence might spell part of a needle and the caller must decode.
+    Needles must be lowercase ASCII letters.
+    """
+    needles = [needle.encode("ascii") for needle in needles]
+    overlap = max(len(needle) for needle in needles) - 1 + ESCAPE_LOOKBEHIND
+    ambiguous = False
+    start = 0
+    while start < len(raw):
+        chunk_start = max(0, start - overlap)
+        chunk = bytes(raw[chunk_start:start + SCAN_CHUNK_BYTES]).lower()
+        for needle in needles:
+            pos = chunk.find(needle)
+            while pos != -1:
+                # Matches this close to the chunk start lie wholly in the previous chunk
+                if chunk_start == 0 or pos >= ESCAPE_LOOKBEHIND:
+                    # Literal unless the first letter is escaped (\f) or a \uXXXX hex digit
+                    before = chunk[max(0, pos - ESCAPE_LOOKBEHIND):pos]
+                    if not before.endswith(b"\\") and b"\\u" not in before:
+                        return True
+                    ambiguous = True
+                pos = chunk.find(needle, pos + 1)
+        if not ambiguous:
+            pos = chunk.find(b"\\u00")
+            while pos != -1:
+                if chunk[pos + 4:pos + 5] in LETTER_ESCAPE_DIGITS:
+                    ambiguous = True
+                    break
+                pos = chunk.find(b"\\u00", pos + 4)
+        start += SCAN_CHUNK_BYTES
+    return None if ambiguous else False
+
+
+class LazyMessage:
+    """Transcript message whose "content" stays undecoded JSON until a detector reads it.
+
+    Supports the dict-style access the detectors use (get, [], in). Tool
+    results are usually the bulk of a transcript; content_mentions() answers
+    substring checks on them straight from the raw bytes when it can.
+    """
+
+    __slots__ = ("_fields", "_raw_content")
+
+    def __init__(self, fields: Dict[str, Any], raw_content: Any = None):
+        self._fields = fields
+        self._raw_content = raw_content
+
+    def _decode_content(self):
+        raw = self._raw_content
+        self._raw_content = None
+        try:
+            self._fields["content"] = msgspec.json.decode(raw)
+        except Exception:
+            self._fields["content"] = json.loads(bytes(raw))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "content" and self._raw_content is not None:
+            self._decode_content()
+        return self._fields.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "content" and self._raw_content is not None:
+            self._decode_content()
+        return self._fields[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._fields or (key == "content" and self._raw_content is not None)
+
+    def content_mentions(self, needles: Iterable[str]) -> bool:
+        """Whether str(content).lower() contains any of needles, decoding only if unavoidable."""
+        raw = self._raw_content
+        if raw is not None:
+            view = memoryview(raw)
+            # Only string literals: str() of a list/dict is a repr that may differ from the JSON
+            if view[:1] == b'"':
+                found = scan_raw_string(view, needles)
+                if found is not None:
+                    return found
+        content_lower = str(self.get("content", "")).lower()
+        return any(needle in content_lower for needle in needles)
+
+
+def content_mentions(msg: Dict[str, Any], needles: Iterable[str]) -> bool:
+    """Whether a message's content, stringified and lowercased, contains any of needles."""
+    if isinstance(msg, LazyMessage):
+        return msg.content_mentions(needles)
+    content_lower = str(msg.get("content", "")).lower()
+    return any(needle in content_lower for needle in needles)
+
+
+class JSONDecoder:
+    """Pluggable JSON decoding: msgspec or orjson when installed, stdlib json otherwise.
+
+    loads() decodes a whole document. loads_message() decodes one transcript
+    line; with msgspec it only materializes MESSAGE_FIELDS and returns a
+    LazyMessage whose content is kept as raw JSON. Any error from a fast
+    backend falls back to stdlib json for that input, so accepted input and
+    results match the stdlib path.
+    """
+
+    def __init__(self, backend: str = "auto"):
+        if backend == "auto":
+            backend = "msgspec" if msgspec is not None else "orjson" if orjson is not None else "json"
+        if backend not in JSON_BACKENDS:
+            raise ValueError(f"Unknown JSON backend {backend!r} (expected one of {', '.join(JSON_BACKENDS)})")
+        if (backend == "msgspec" and msgspec is None) or (backend == "orjson" and orjson is None):
+            raise ValueError(f"JSON backend {backend!r} is not installed")
+        self.name = backend
+        self._fast_loads = None
+        self._fast_message = None
+        if backend == "msgspec":
+            message_type = msgspec.defstruct(
+                "TranscriptMessage",
+                [(field, msgspec.Raw if field == "content" else Any, msgspec.UNSET) for field in MESSAGE_FIELDS],
+            )
+            self._fast_loads = msgspec.json.Decoder().decode
+            self._fast_message = msgspec.json.Decoder(message_type).decode
+        elif backend == "orjson":
+            self._fast_loads = self._fast_message = orjson.loads
+
+    def loads(self, data: bytes) -> Any:
+        """Decode a complete JSON document."""
+        if self._fast_loads is not None:
+            try:
+                return self._fast_loads(data)
+            except Exception:
+                pass
+        return json.loads(data)
+
+    def loads_message(self, data: bytes) -> Any:
+        """Decode one transcript line, keeping only the fields the detectors read when possible."""
+        if self._fast_message is None:
+            return json.loads(data)
+        try:
+            message = self._fast_message(data)
+        except Exception:
+            return json.loads(data)
+        if self.name == "msgspec":
+            fields = {
+                field: value
+                for field in MESSAGE_FIELDS
+                if field != "content" and (value := getattr(message, field)) is not msgspec.UNSET
+            }
+            return LazyMessage(fields, None if message.content is msgspec.UNSET else message.content)
+        return message
+
+
+@cache
+def get_decoder(backend: str = "auto") -> JSONDecoder:
+    """Process-wide JSONDecoder per backend (kept out of SessionAnalyzer so it stays picklable)."""
+    return JSONDecoder(backend)
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an ISO timestamp as an aware datetime (naive values are taken as UTC); None if unparseable."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def contains_any(value: Any, needles: Iterable[str]) -> bool:
+    """Case-insensitive: does str(value) contain any of needles?"""
+    value = str(value or "").lower()
+    return any(needle.lower() in value for needle in needles)
+
+
+@dataclass(frozen=True)
+class SessionFilter:
+    """Which sessions to analyze, decided before any transcript is opened.
+
+    since/until bound the session's created time (metadata "created", else the
+    session directory's mtime) as [since, until); naive datetimes are local
+    time. projects, bundles and models keep sessions whose project directory
+    name, metadata bundle or metadata model contains any of the given strings
+    (case-insensitive). Empty fields don't filter.
+    """
+
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    projects: tuple[str, ...] = ()
+    bundles: tuple[str, ...] = ()
+    models: tuple[str, ...] = ()
+
+    def __post_init__(self):
+        for name in ("since", "until"):
+            value = getattr(self, name)
+            if value is not None and value.tzinfo is None:
+                object.__setattr__(self, name, value.astimezone())
+
+    def __str__(self) -> str:
+        parts = []
+        if self.since is not None:
+            parts.append(f"since {self.since:%Y-%m-%d %H:%M}")
+        if self.until is not None:
+            parts.append(f"until {self.until:%Y-%m-%d %H:%M}")
+        for label, values in (("project", self.projects), ("bundle", self.bundles), ("model", self.models)):
+            if values:
+                parts.append(f"{label} ~ {'|'.join(values)}")
+        return ", ".join(parts) or "all sessions"
+
+    @property
+    def needs_metadata(self) -> bool:
+        return self.since is not None or self.until is not None or bool(self.bundles or self.models)
+
+    @property
+    def needs_mtime(self) -> bool:
+        """Whether the time window applies, which needs each session directory's mtime."""
+        return self.since is not None or self.until is not None
+
+    def matches_project(self, project: str) -> bool:
+        return not self.projects or contains_any(project, self.projects)
+
+    def may_match_directory(self, mtime: float) -> bool:
+        """False when a session directory last modified at mtime must have been created before since."""
+        return self.since is None or mtime >= self.since.timestamp()
+
+    def matches_metadata(self, metadata: Dict[str, Any], mtime: float) -> bool:
+        if self.since is not None or self.until is not None:
+            created = parse_timestamp(metadata.get("created")) or datetime.fromtimestamp(mtime, timezone.utc)
+            if self.since is not None and created < self.since:
+                return False
+            if self.until is not None and created >= self.until:
+                return False
+        if self.bundles and not contains_any(metadata.get("bundle"), self.bundles):
+            return False
+        if self.models and not contains_any(metadata.get("model"), self.models):
+            return False
+        return True
+
+
+def scan_dirs(path: Path) -> Iterator[os.DirEntry]:
+    """Subdirectories of path via os.scandir; nothing if path is missing or unreadable."""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:  # removed or unreadable since it was listed
+                    continue
+                if is_dir:
+                    yield entry
+    except OSError:
+        return
+
+
+def with_next(messages: Iterable[Dict]) -> Iterator[tuple[Dict, Dict | None]]:
+    """Yield (message, next_message) pairs with one message of lookahead; next is None at the end."""
+    end = object()
+    iterator = iter(messages)
+    current = next(iterator, end)
+    while current is not end:
+        following = next(iterator, end)
+        yield current, None if following is end else following
+        current = following
+
+
+class PatternDetector:
+    """Single-pass engine behind all seven SessionAnalyzer.detect_* functions.
+
+    Each message is visited once via feed(); every field is stringified and
+    lowercased at most once and the result shared by all detectors. results()
+    returns exactly what the individual detect_* methods return for the same
+    messages (SessionAnalyzer.verify_pattern_detector checks this on a corpus).
+    """
+
+    def __init__(self):
+        # delegation
+        self.agents_used = []
+        self.delegation_count = 0
+        # iteration
+        self.iterations = 0
+        # exploration
+        self.tool_usage = Counter()
+        self.parallel_searches = 0
+        # implementation
+        self.write_operations = 0
+        self.edit_operations = 0
+        # error recovery: an error waits for the next message to see if it is a recovery
+        self.errors = 0
+        self.recovery_attempts = 0
+        self.pending_error = False
+        # planning vs execution
+        self.planning_messages = 0
+        self.execution_messages = 0
+        # validation
+        self.test_runs = 0
+        self.checks = 0
+        self.reviews = 0
+
+    def feed(self, msg: Dict[str, Any]):
+        """Update every detector with the next message."""
+        role = msg.get("role")
+
+        if self.pending_error:
+            self.pending_error = False
+            if role == "assistant":
+                self.recovery_attempts += 1
+
+        if role == "user":
+            content = msg.get("content", "")
+            content_lower = str(content).lower()
+            if isinstance(content, str) and "use " in content_lower and "agent" in content_lower:
+                self.delegation_count += 1
+                match = AGENT_NAME_PATTERN.search(content)
+                if match:
+                    self.agents_used.append(match.group(1))
+            if any(keyword in content_lower for keyword in REFINEMENT_KEYWORDS):
+                self.iterations += 1
+
+        elif role == "assistant":
+            tool_calls = msg.get("tool_calls", [])
+            if len(tool_calls) > 1:
+                self.parallel_searches += 1
+            for call in tool_calls:
+                tool = call.get("tool", "")
+                if "agent" in tool or "delegate" in tool:
+                    self.delegation_count += 1
+                if tool in EXPLORATION_TOOLS:
+                    self.tool_usage[tool] += 1
+                if tool == "write_file":
+                    self.write_operations += 1
+                elif tool == "edit_file":
+                    self.edit_operations += 1
+
+                args_lower = str(call.get("arguments", {})).lower()
+                tool_lower = tool.lower()
+                if "test" in args_lower or "test" in tool_lower:
+                    self.test_runs += 1
+                if tool == "python_check":
+                    self.checks += 1
+                if "review" in args_lower or "review" in tool_lower:
+                    self.reviews += 1
+
+            content = msg.get("content", [])
+            if isinstance(content, list):
+                for item in content:
+                    item_type = item.get("type")
+                    if item_type == "thinking":
+                        self.planning_messages += 1
+                    elif item_type == "tool_call":
+                        self.execution_messages += 1
+
+        elif role == "tool":
+            # Tool output can be megabytes: check it from the raw bytes where possible
+            if content_mentions(msg, ERROR_MARKERS):
+                self.errors += 1
+                self.pending_error = True
+
+    def results(self) -> Dict[str, Dict[str, Any]]:
+        """Pattern results keyed like SessionAnalyzer.analyze_session's "patterns"."""
+        total_exploration = sum(self.tool_usage.values())
+        total_ops = self.write_operations + self.edit_operations
+        total_planning = self.planning_messages + self.execution_messages
+        planning_ratio = self.planning_messages / total_planning if total_planning > 0 else 0
+        total_validation = self.test_runs + self.checks + self.reviews
+
+        return {
+            "delegation": {
+                "delegation_count": self.delegation_count,
+                "agents_used": sorted(set(self.agents_used)),
+                "has_delegation": self.delegation_count > 0,
+            },
+            "iteration": {"iteration_count": self.iterations, "is_iterative": self.iterations >= 2},
+            "exploration": {
+                "exploration_tool_count": total_exploration,
+                "parallel_searches": self.parallel_searches,
+                "is_exploratory": total_exploration >= 5 or self.parallel_searches >= 2,
+                "tools_used": dict(self.tool_usage),
+            },
+            "implementation": {
+                "write_operations": self.write_operations,
+                "edit_operations": self.edit_operations,
+                "total_file_ops": total_ops,
+                "is_implementation": total_ops >= 3,
+            },
+            "error_recovery": {
+                "errors_encountered": self.errors,
+                "recovery_attempts": self.recovery_attempts,
+                "has_error_recovery": self.errors > 0 and self.recovery_attempts > 0,
+                "recovery_rate": self.recovery_attempts / self.errors if self.errors > 0 else 0,
+            },
+            "planning_execution": {
+                "planning_messages": self.planning_messages,
+                "execution_messages": self.execution_messages,
+                "planning_ratio": planning_ratio,
+                "approach": "planning-heavy"
+                if planning_ratio > 0.6
+                else "execution-heavy"
+                if planning_ratio < 0.3
+                else "balanced",
+            },
+            "validation": {
+                "test_runs": self.test_runs,
+                "code_checks": self.checks,
+                "reviews": self.reviews,
+                "total_validation": total_validation,
+                "has_validation": total_validation > 0,
+            },
+        }
+
+
+# Typed per-session columns for export_to_columnar, flattened from the
+# "patterns" dict as <pattern>_<field>. tools_used goes to its own table.
+PATTERN_COLUMNS = [
+    ("delegation", "delegation_count", "int"),
+    ("delegation", "agents_used", "list"),
+    ("delegation", "has_delegation", "bool"),
+    ("iteration", "iteration_count", "int"),
+    ("iteration", "is_iterative", "bool"),
+    ("exploration", "exploration_tool_count", "int"),
+    ("exploration", "parallel_searches", "int"),
+    ("exploration", "is_exploratory", "bool"),
+    ("implementation", "write_operations", "int"),
+    ("implementation", "edit_operations", "int"),
+    ("implementation", "total_file_ops", "int"),
+    ("implementation", "is_implementation", "bool"),
+    ("error_recovery", "errors_encountered", "int"),
+    ("error_recovery", "recovery_attempts", "int"),
+    ("error_recovery", "has_error_recovery", "bool"),
+    ("error_recovery", "recovery_rate", "float"),
+    ("planning_execution", "planning_messages", "int"),
+    ("planning_execution", "execution_messages", "int"),
+    ("planning_execution", "planning_ratio", "float"),
+    ("planning_execution", "approach", "str"),
+    ("validation", "test_runs", "int"),
+    ("validation", "code_checks", "int"),
+    ("validation", "reviews", "int"),
+    ("validation", "total_validation", "int"),
+    ("validation", "has_validation", "bool"),
+]
+COLUMNAR_FORMATS = {".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow"}
+COLUMNAR_NEEDS_PYARROW = (
+    "Columnar export needs pyarrow: uv run --with pyarrow python tools/analyze_sessions.py --columnar ..."
+)
+
+
+def check_columnar_output(output_path: str | Path):
+    """Raise ValueError/ImportError if export_to_columnar can't write output_path.
+
+    Cheap (pyarrow is located, not imported), so CLIs call it before analyzing.
+    """
+    suffix = Path(output_path).suffix
+    if suffix not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported columnar format {suffix!r} (use {', '.join(COLUMNAR_FORMATS)})")
+    if importlib.util.find_spec("pyarrow") is None:
+        raise ImportError(COLUMNAR_NEEDS_PYARROW)
+
+
+# export_to_csv header; SessionRecord.csv_row() gives the matching values for one session
+CSV_COLUMNS = [
+    "Session ID",
+    "Parent Session",
+    "Created",
+    "Name",
+    "Project",
+    "Bundle",
+    "Model",
+    "Turn Count",
+    "Message Count",
+    "Duration (min)",
+    "Primary Approach",
+    "All Approaches",
+    "Is Iterative",
+    "Iteration Count",
+    "Is Exploratory",
+    "Exploration Count",
+    "Has Delegation",
+    "Delegation Count",
+    "File Operations",
+    "Errors",
+    "Recovery Rate",
+    "Validation Count",
+    "Planning Ratio",
+    "Success Indicators",
+]
+
+
+class SessionRecord:
+    """Compact, flat form of one analyze_session() result.
+
+    Holds the CSV_COLUMNS fields (slot order matches the columns) with
+    approaches and success_indicators kept as tuples, so exports and the
+    dashboard never re-split joined strings. Much smaller than the result
+    dict, whose nested patterns are only needed for the JSON and columnar
+    exports.
+    """
+
+    __slots__ = (
+        "session_id",
+        "parent_session_id",
+        "created",
+        "name",
+        "project",
+        "bundle",
+        "model",
+        "turn_count",
+        "message_count",
+        "duration_minutes",
+        "primary_approach",
+        "approaches",
+        "is_iterative",
+        "iteration_count",
+        "is_exploratory",
+        "exploration_count",
+        "has_delegation",
+        "delegation_count",
+        "file_operations",
+        "errors",
+        "recovery_rate",
+        "validation_count",
+        "planning_ratio",
+        "success_indicators",
+    )
+
+    def __init__(self, *values: Any):
+        for name, value in zip(self.__slots__, values, strict=True):
+            setattr(self, name, value)
+
+    @classmethod
+    def from_result(cls, s: Dict[str, Any]) -> "SessionRecord":
+        """Flatten an analyze_session() result."""
+        patterns = s["patterns"]
+        return cls(
+            s["session_id"],
+            s["parent_session_id"],
+            s["created"],
+            s["name"],
+            s["project"],
+            s["bundle"],
+            s["model"],
+            s["turn_count"],
+            s["message_count"],
+            s["duration_minutes"],
+            s["primary_approach"],
+            tuple(s["approaches"]),
+            patterns["iteration"]["is_iterative"],
+            patterns["iteration"]["iteration_count"],
+            patterns["exploration"]["is_exploratory"],
+            patterns["exploration"]["exploration_tool_count"],
+            patterns["delegation"]["has_delegation"],
+            patterns["delegation"]["delegation_count"],
+            patterns["implementation"]["total_file_ops"],
+            patterns["error_recovery"]["errors_encountered"],
+            patterns["error_recovery"]["recovery_rate"],
+            patterns["validation"]["total_validation"],
+            patterns["planning_execution"]["planning_ratio"],
+            tuple(s["success_indicators"]),
+        )
+
+    def csv_row(self) -> List[Any]:
+        """The CSV_COLUMNS row (multi-valued fields joined with ", ")."""
+        return [
+            self.session_id,
+            self.parent_session_id,
+            self.created,
+            self.name,
+            self.project,
+            self.bundle,
+            self.model,
+            self.turn_count,
+            self.message_count,
+            self.duration_minutes,
+            self.primary_approach,
+            ", ".join(self.approaches),
+            self.is_iterative,
+            self.iteration_count,
+            self.is_exploratory,
+            self.exploration_count,
+            self.has_delegation,
+            self.delegation_count,
+            self.file_operations,
+            self.errors,
+            self.recovery_rate,
+            self.validation_count,
+            round(self.planning_ratio, 2),
+            ", ".join(self.success_indicators),
+        ]
+
+
+# pattern_statistics counters: sessions where patterns[pattern][flag] is true
+SUMMARY_PATTERN_FLAGS = {
+    "iterative_sessions": ("iteration", "is_iterative"),
+    "exploratory_sessions": ("exploration", "is_exploratory"),
+    "implementation_sessions": ("implementation", "is_implementation"),
+    "delegated_sessions": ("delegation", "has_delegation"),
+    "validated_sessions": ("validation", "has_validation"),
+    "error_recovery_sessions": ("error_recovery", "has_error_recovery"),
+}
+
+
+class SummaryAggregator:
+    """Streaming summary statistics over analyze_session results.
+
+    add() folds in one session; result() returns the same dict
+    generate_summary_statistics always has.
+    """
+
+    def __init__(self):
+        self.total_sessions = 0
+        self.total_turns = 0
+        self.total_duration = 0.0
+        self.approach_counts = Counter()
+        self.pattern_counts = dict.fromkeys(SUMMARY_PATTERN_FLAGS, 0)
+        self.date_counts = Counter()
+
+    def add(self, session: Dict[str, Any]):
+        self.total_sessions += 1
+        self.total_turns += session["turn_count"]
+        self.total_duration += session["duration_minutes"]
+        self.approach_counts.update(session["approaches"])
+        patterns = session["patterns"]
+        for name, (pattern, flag) in SUMMARY_PATTERN_FLAGS.items():
+            if patterns[pattern][flag]:
+                self.pattern_counts[name] += 1
+        self.date_counts[session["created"][:10] if session["created"] else "unknown"] += 1
+
+    def result(self) -> Dict[str, Any]:
+        total = self.total_sessions
+        return {
+            "total_sessions": total,
+            "approach_frequencies": dict(self.approach_counts),
+            "average_turns": round(self.total_turns / total, 2) if total else 0,
+            "average_duration_minutes": round(self.total_duration / total, 2) if total else 0,
+            "pattern_statistics": dict(self.pattern_counts),
+            "sessions_by_date": dict(sorted(self.date_counts.items())),
+        }
 
 
 class SessionAnalyzer:
-    def __init__(self, projects_dir: str):
+    def __init__(self, projects_dir: str, json_backend: str = "auto"):
         self.projects_dir = Path(projects_dir)
         self.sessions = []
         self.patterns = defaultdict(list)
-
-    def find_all_sessions(self) -> List[Path]:
-        """Find all session metadata.json files."""
+        self.last_run_stats: Dict[str, float] = {}
+        self.last_run_summary = SummaryAggregator()
+        self.json_backend = get_decoder(json_backend).name
+        # Metadata read by find_all_sessions for filtering, reused by analyze_all_sessions
+        self._peeked_metadata: Dict[Path, Dict[str, Any]] = {}
+
+    @property
+    def decoder(self) -> JSONDecoder:
+        return get_decoder(self.json_backend)
+
+    def find_all_sessions(self, session_filter: Optional[SessionFilter] = None) -> List[Path]:
+        """Find session metadata.json files under projects/*/sessions/*.
+
+        Only that layout is scanned, so artifact trees inside sessions are never
+        walked. With a session_filter, sessions are dropped before any
+        transcript is opened: projects by directory name, session directories
+        last modified before since (so created before it too) without reading
+        them, and the rest by their metadata. Directories are only stat'ed for
+        a time window, and metadata is only read when a filter needs it; what
+        was read is kept so analyze_all_sessions doesn't read it again.
+        """
         metadata_files = []
-        for root, dirs, files in os.walk(self.projects_dir):
-            if "metadata.json" in files and "sessions" in root:
-                metadata_files.append(Path(root) / "metadata.json")
+        self._peeked_metadata = {}
+        needs_mtime = session_filter is not None and session_filter.needs_mtime
+        needs_metadata = session_filter is not None and session_filter.needs_metadata
+        for project in scan_dirs(self.projects_dir):
+            if session_filter is not None and not session_filter.matches_project(project.name):
+                continue
+            for session in scan_dirs(Path(project.path) / "sessions"):
+                mtime = 0.0
+                if needs_mtime:
+                    try:
+                        mtime = session.stat().st_mtime
+                    except OSError:  # removed or unreadable since it was listed
+                        continue
+                    if not session_filter.may_match_directory(mtime):
+                        continue
+                metadata_path = Path(session.path) / "metadata.json"
+                if not metadata_path.is_file():
+                    continue
+                if needs_metadata:
+                    metadata = self.peek_metadata(metadata_path)
+                    if not session_filter.matches_metadata(metadata, mtime):
+                        continue
+                    if metadata:
+                        self._peeked_metadata[metadata_path] = metadata
+                metadata_files.append(metadata_path)
         return sorted(metadata_files)
 
+    def peek_metadata(self, metadata_path: Path) -> Dict[str, Any]:
+        """Metadata for filtering; {} if unreadable (analyze_session reports the error later)."""
+        try:
+            with open(metadata_path, "rb") as f:
+                metadata = self.decoder.loads(f.read())
+        except Exception:
+            return {}
+        return metadata if isinstance(metadata, dict) else {}
+
     def parse_metadata(self, metadata_path: Path) -> Dict[str, Any]:
         """Parse session metadata."""
         try:
-            with open(metadata_path, "r") as f:
-                data = json.load(f)
+            with open(metadata_path, "rb") as f:
+                data = self.decoder.loads(f.read())
             return data
         except Exception as e:
             print(f"Error parsing {metadata_path}: {e}")
             return {}
 
-    def parse_transcript(self, session_dir: Path) -> List[Dict[str, Any]]:
-        """Parse session transcript."""
+    def iter_transcript(self, session_dir: Path) -> Iterator[Dict[str, Any]]:
+        """Stream messages from a session transcript one line at a time.
+
+        Stops at the first unreadable line, like parse_transcript, so callers
+        see the messages parsed before the error.
+        """
         transcript_path = session_dir / "transcript.jsonl"
         if not transcript_path.exists():
-            return []
+            return
 
-        messages = []
+        loads_message = self.decoder.loads_message
         try:
-            with open(transcript_path, "r") as f:
+            with open(transcript_path, "rb") as f:
                 for line in f:
                     if line.strip():
-                        messages.append(json.loads(line))
+                        yield loads_message(line)
         except Exception as e:
             print(f"Error parsing transcript {transcript_path}: {e}")
 
-        return messages
+    def parse_transcript(self, session_dir: Path) -> List[Dict[str, Any]]:
+        """Parse session transcript."""
+        return list(self.iter_transcript(session_dir))
 
     def detect_delegation_pattern(self, messages: List[Dict]) -> Dict[str, Any]:
         """Detect agent delegation patterns."""
@@ -81,35 +827,24 @@ class SessionAnalyzer:
 
         return {
             "delegation_count": delegation_count,
-            "agents_used": list(set(agents_used)),
+            "agents_used": sorted(set(agents_used)),
             "has_delegation": delegation_count > 0,
         }
 
     def detect_iteration_pattern(self, messages: List[Dict]) -> Dict[str, Any]:
         """Detect iterative refinement patterns."""
         iterations = 0
-        refinement_keywords = [
-            "refine",
-            "improve",
-            "fix",
-            "update",
-            "revise",
-            "modify",
-            "adjust",
-            "correct",
-        ]
 
         for msg in messages:
             if msg.get("role") == "user":
                 content = str(msg.get("content", "")).lower()
-                if any(keyword in content for keyword in refinement_keywords):
+                if any(keyword in content for keyword in REFINEMENT_KEYWORDS):
                     iterations += 1
 
         return {"iteration_count": iterations, "is_iterative": iterations >= 2}
 
     def detect_exploration_pattern(self, messages: List[Dict]) -> Dict[str, Any]:
         """Detect exploratory investigation patterns."""
-        exploration_tools = ["read_file", "glob", "grep", "bash", "web_search"]
         tool_usage = Counter()
         parallel_searches = 0
 
@@ -121,7 +856,7 @@ class SessionAnalyzer:
 
                 for call in tool_calls:
                     tool = call.get("tool", "")
-                    if tool in exploration_tools:
+                    if tool in EXPLORATION_TOOLS:
                         tool_usage[tool] += 1
 
         total_exploration = sum(tool_usage.values())
@@ -157,21 +892,18 @@ class SessionAnalyzer:
             "is_implementation": total_ops >= 3,
         }
 
-    def detect_error_recovery(self, messages: List[Dict]) -> Dict[str, Any]:
+    def detect_error_recovery(self, messages: Iterable[Dict]) -> Dict[str, Any]:
         """Detect error recovery approaches."""
         errors = 0
         recovery_attempts = 0
 
-        for i, msg in enumerate(messages):
+        for msg, next_msg in with_next(messages):
             if msg.get("role") == "tool":
                 content = str(msg.get("content", ""))
                 if "error" in content.lower() or "failed" in content.lower():
                     errors += 1
                     # Check if next assistant message attempts recovery
-                    if (
-                        i + 1 < len(messages)
-                        and messages[i + 1].get("role") == "assistant"
-                    ):
+                    if next_msg is not None and next_msg.get("role") == "assistant":
                         recovery_attempts += 1
 
         return {
@@ -245,10 +977,12 @@ class SessionAnalyzer:
         if len(messages) < 2:
             return 0
 
-        try:
-            first_ts = messages[0].get("timestamp", "")
-            last_ts = messages[-1].get("timestamp", "")
+        return self.duration_between(messages[0].get("timestamp", ""), messages[-1].get("timestamp", ""))
 
+    @staticmethod
+    def duration_between(first_ts: str, last_ts: str) -> float:
+        """Minutes between two ISO timestamps (0 if either is missing or unparseable)."""
+        try:
             if first_ts and last_ts:
                 first_time = datetime.fromisoformat(first_ts.replace("+00:00", ""))
                 last_time = datetime.fromisoformat(last_ts.replace("+00:00", ""))
@@ -289,27 +1023,38 @@ class SessionAnalyzer:
 
         return approaches
 
-    def analyze_session(self, metadata_path: Path) -> Dict[str, Any] | None:
-        """Analyze a single session."""
-        metadata = self.parse_metadata(metadata_path)
+    def analyze_session(
+        self, metadata_path: Path, metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any] | None:
+        """Analyze a single session.
+
+        The transcript is streamed through the pattern detector, so memory use
+        does not grow with transcript length; only the first and last
+        timestamps are kept for the duration. metadata, if already read, saves
+        parsing metadata.json again.
+        """
+        if metadata is None:
+            metadata = self.parse_metadata(metadata_path)
+        if not metadata:
+            return None
         session_dir = metadata_path.parent
-        messages = self.parse_transcript(session_dir)
 
-        if not metadata or not messages:
+        # Detect patterns in a single pass over the transcript
+        detector = PatternDetector()
+        message_count = 0
+        first_ts = last_ts = ""
+        for msg in self.iter_transcript(session_dir):
+            detector.feed(msg)
+            last_ts = msg.get("timestamp", "")
+            if message_count == 0:
+                first_ts = last_ts
+            message_count += 1
+
+        if not message_count:
             return None
+        patterns = detector.results()
 
-        # Detect patterns
-        patterns = {
-            "delegation": self.detect_delegation_pattern(messages),
-            "iteration": self.detect_iteration_pattern(messages),
-            "exploration": self.detect_exploration_pattern(messages),
-            "implementation": self.detect_implementation_pattern(messages),
-            "error_recovery": self.detect_error_recovery(messages),
-            "planning_execution": self.detect_planning_vs_execution(messages),
-            "validation": self.detect_validation_pattern(messages),
-        }
-
-        duration = self.calculate_session_duration(messages)
+        duration = self.duration_between(first_ts, last_ts) if message_count >= 2 else 0
         approaches = self.categorize_approach(patterns)
 
         # Determine success indicators
@@ -334,7 +1079,7 @@ class SessionAnalyzer:
             "bundle": metadata.get("bundle", ""),
             "model": metadata.get("model", ""),
             "turn_count": metadata.get("turn_count", 0),
-            "message_count": len(messages),
+            "message_count": message_count,
             "duration_minutes": duration,
             "approaches": approaches,
             "primary_approach": approaches[0] if approaches else "Unknown",
@@ -345,81 +1090,147 @@ class SessionAnalyzer:
             .split("/sessions/")[0],
         }
 
-    def analyze_all_sessions(self) -> List[Dict[str, Any]]:
-        """Analyze all sessions."""
-        metadata_files = self.find_all_sessions()
-        print(f"Found {len(metadata_files)} sessions to analyze...")
+    def detect_patterns_separately(self, messages: List[Dict]) -> Dict[str, Dict[str, Any]]:
+        """Run the seven per-detector functions individually (reference for PatternDetector)."""
+        return {
+            "delegation": self.detect_delegation_pattern(messages),
+            "iteration": self.detect_iteration_pattern(messages),
+            "exploration": self.detect_exploration_pattern(messages),
+            "implementation": self.detect_implementation_pattern(messages),
+            "error_recovery": self.detect_error_recovery(messages),
+            "planning_execution": self.detect_planning_vs_execution(messages),
+            "validation": self.detect_validation_pattern(messages),
+        }
 
+    def verify_pattern_detector(self, session_filter: Optional[SessionFilter] = None) -> List[Path]:
+        """Check that the fused PatternDetector matches the per-detector functions on every session.
+
+        Returns the transcripts whose results differ (empty when equivalent).
+        """
+        mismatches = []
+        for metadata_path in self.find_all_sessions(session_filter):
+            messages = self.parse_transcript(metadata_path.parent)
+            detector = PatternDetector()
+            for msg in messages:
+                detector.feed(msg)
+            if detector.results() != self.detect_patterns_separately(messages):
+                mismatches.append(metadata_path.parent / "transcript.jsonl")
+        return mismatches
+
+    @staticmethod
+    def session_bytes(metadata_path: Path) -> int:
+        """On-disk size of a session's metadata and transcript."""
+        total = 0
+        for path in (metadata_path, metadata_path.parent / "transcript.jsonl"):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def analyze_all_sessions(
+        self,
+        workers: int = 1,
+        cache: Optional["SessionCache"] = None,
+        session_filter: Optional[SessionFilter] = None,
+        as_record: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> List[Any]:
+        """Analyze all sessions, or only those matching session_filter.
+
+        With workers > 1, sessions are sharded across a process pool. Results
+        keep the sorted discovery order regardless of which worker finishes
+        first, so output is identical to a serial run. With a cache, sessions
+        whose files are unchanged since the last run are not re-analyzed,
+        and rows for sessions that have since been deleted are pruned.
+        Each result is folded into last_run_summary as it arrives, so the
+        summary statistics are ready when this returns.
+
+        With as_record (e.g. SessionRecord.from_result), only the converted
+        form of each result is kept; the full result dicts are released as
+        soon as they are summarized and, in batches, cached.
+        """
+        metadata_files = self.find_all_sessions(session_filter)
+        matching = f" ({session_filter})" if session_filter is not None else ""
+        print(f"Found {len(metadata_files)} sessions{matching} to analyze...")
+
+        start = time.perf_counter()
+        analyzed: Dict[Path, Dict[str, Any] | None] = {}
+        fingerprints = {}
+        if cache is not None:
+            for metadata_path in metadata_files:
+                fingerprints[metadata_path] = cache.fingerprint(metadata_path)
+            analyzed.update(cache.lookup(fingerprints))
+        pending = [path for path in metadata_files if path not in analyzed]
+        # Taken off self so the pool doesn't pickle every peeked dict along with the analyzer
+        peeked, self._peeked_metadata = self._peeked_metadata, {}
+        pending_metadata = [peeked.get(path) for path in pending]
+        del peeked
+        if analyzed:
+            print(f"Reusing {len(analyzed)} cached results, analyzing {len(pending)}...")
+
+        summary = SummaryAggregator()
         results = []
-        for i, metadata_path in enumerate(metadata_files):
-            if i % 10 == 0:
-                print(f"Progress: {i}/{len(metadata_files)}")
-
-            result = self.analyze_session(metadata_path)
-            if result:
-                results.append(result)
+        uncached = []  # fresh (metadata_path, fingerprint, result) entries not yet stored
+        parallel = workers > 1 and len(pending) > 1
+        with ProcessPoolExecutor(max_workers=workers) if parallel else nullcontext() as pool:
+            if parallel:
+                chunksize = max(1, len(pending) // (workers * 8))
+                fresh = pool.map(self.analyze_session, pending, pending_metadata, chunksize=chunksize)
+            else:
+                fresh = map(self.analyze_session, pending, pending_metadata)
+            # Walk discovery order, pulling fresh results (in order) for the sessions the cache missed
+            done = 0
+            for metadata_path in metadata_files:
+                if metadata_path in analyzed:
+                    result = analyzed.pop(metadata_path)
+                else:
+                    if done % 10 == 0:
+                        print(f"Progress: {done}/{len(pending)}")
+                    result = next(fresh)
+                    done += 1
+                    if cache is not None:
+                        uncached.append((metadata_path, fingerprints[metadata_path], result))
+                        if len(uncached) >= CACHE_STORE_BATCH:
+                            cache.store(uncached)
+                            uncached = []
+                if result:
+                    results.append(result if as_record is None else as_record(result))
+                    summary.add(result)
+
+        if uncached:
+            cache.store(uncached)
+        if cache is not None:
+            pruned = cache.prune()
+            if pruned:
+                print(f"Pruned {pruned} cached results for deleted sessions")
+        self.last_run_summary = summary
+
+        elapsed = time.perf_counter() - start
+        total_mb = sum(self.session_bytes(path) for path in pending) / (1024 * 1024)
+        self.last_run_stats = {
+            "sessions": len(metadata_files),
+            "analyzed": len(pending),
+            "cached": len(metadata_files) - len(pending),
+            "seconds": round(elapsed, 3),
+            "megabytes": round(total_mb, 2),
+            "sessions_per_second": round(len(metadata_files) / elapsed, 1) if elapsed else 0,
+            "mb_per_second": round(total_mb / elapsed, 2) if elapsed else 0,
+        }
+        print(
+            f"⚡ Processed {len(metadata_files)} sessions ({len(pending)} analyzed, "
+            f"{self.last_run_stats['cached']} cached, {total_mb:.1f} MB read) in {elapsed:.2f}s "
+            f"with {max(workers, 1)} worker(s): "
+            f"{self.last_run_stats['sessions_per_second']} sessions/s, {self.last_run_stats['mb_per_second']} MB/s"
+        )
 
         return results
 
     def generate_summary_statistics(self, sessions: List[Dict]) -> Dict[str, Any]:
-        """Generate summary statistics."""
-        approach_counts = Counter()
+        """Generate summary statistics in one pass (analyze_all_sessions already keeps last_run_summary)."""
+        summary = SummaryAggregator()
         for session in sessions:
-            for approach in session["approaches"]:
-                approach_counts[approach] += 1
-
-        # Calculate averages
-        avg_turns = (
-            sum(s["turn_count"] for s in sessions) / len(sessions) if sessions else 0
-        )
-        avg_duration = (
-            sum(s["duration_minutes"] for s in sessions) / len(sessions)
-            if sessions
-            else 0
-        )
-
-        # Pattern frequencies
-        pattern_stats = {
-            "iterative_sessions": sum(
-                1 for s in sessions if s["patterns"]["iteration"]["is_iterative"]
-            ),
-            "exploratory_sessions": sum(
-                1 for s in sessions if s["patterns"]["exploration"]["is_exploratory"]
-            ),
-            "implementation_sessions": sum(
-                1
-                for s in sessions
-                if s["patterns"]["implementation"]["is_implementation"]
-            ),
-            "delegated_sessions": sum(
-                1 for s in sessions if s["patterns"]["delegation"]["has_delegation"]
-            ),
-            "validated_sessions": sum(
-                1 for s in sessions if s["patterns"]["validation"]["has_validation"]
-            ),
-            "error_recovery_sessions": sum(
-                1
-                for s in sessions
-                if s["patterns"]["error_recovery"]["has_error_recovery"]
-            ),
-        }
-
-        # Time trends
-        sessions_by_date = defaultdict(list)
-        for session in sessions:
-            date = session["created"][:10] if session["created"] else "unknown"
-            sessions_by_date[date].append(session)
-
-        return {
-            "total_sessions": len(sessions),
-            "approach_frequencies": dict(approach_counts),
-            "average_turns": round(avg_turns, 2),
-            "average_duration_minutes": round(avg_duration, 2),
-            "pattern_statistics": pattern_stats,
-            "sessions_by_date": {
-                date: len(sess) for date, sess in sorted(sessions_by_date.items())
-            },
-        }
+            summary.add(session)
+        return summary.result()
 
     def export_to_json(self, sessions: List[Dict], summary: Dict, output_path: str):
         """Export results to JSON."""
@@ -434,96 +1245,280 @@ class SessionAnalyzer:
 
         print(f"\n✅ Exported to {output_path}")
 
-    def export_to_csv(self, sessions: List[Dict], output_path: str):
-        """Export sessions to CSV for Excel."""
+    def export_to_csv(self, sessions: List[Dict | SessionRecord], output_path: str):
+        """Export sessions (result dicts or SessionRecords) to CSV for Excel."""
         import csv
 
         with open(output_path, "w", newline="") as f:
             writer = csv.writer(f)
 
-            # Header
-            writer.writerow(
-                [
-                    "Session ID",
-                    "Parent Session",
-                    "Created",
-                    "Name",
-                    "Project",
-                    "Bundle",
-                    "Model",
-                    "Turn Count",
-                    "Message Count",
-                    "Duration (min)",
-                    "Primary Approach",
-                    "All Approaches",
-                    "Is Iterative",
-                    "Iteration Count",
-                    "Is Exploratory",
-                    "Exploration Count",
-                    "Has Delegation",
-                    "Delegation Count",
-                    "File Operations",
-                    "Errors",
-                    "Recovery Rate",
-                    "Validation Count",
-                    "Planning Ratio",
-                    "Success Indicators",
-                ]
-            )
-
-            # Data rows
+            writer.writerow(CSV_COLUMNS)
             for s in sessions:
-                writer.writerow(
-                    [
-                        s["session_id"],
-                        s["parent_session_id"],
-                        s["created"],
-                        s["name"],
-                        s["project"],
-                        s["bundle"],
-                        s["model"],
-                        s["turn_count"],
-                        s["message_count"],
-                        s["duration_minutes"],
-                        s["primary_approach"],
-                        ", ".join(s["approaches"]),
-                        s["patterns"]["iteration"]["is_iterative"],
-                        s["patterns"]["iteration"]["iteration_count"],
-                        s["patterns"]["exploration"]["is_exploratory"],
-                        s["patterns"]["exploration"]["exploration_tool_count"],
-                        s["patterns"]["delegation"]["has_delegation"],
-                        s["patterns"]["delegation"]["delegation_count"],
-                        s["patterns"]["implementation"]["total_file_ops"],
-                        s["patterns"]["error_recovery"]["errors_encountered"],
-                        s["patterns"]["error_recovery"]["recovery_rate"],
-                        s["patterns"]["validation"]["total_validation"],
-                        round(s["patterns"]["planning_execution"]["planning_ratio"], 2),
-                        ", ".join(s["success_indicators"]),
-                    ]
-                )
+                record = s if isinstance(s, SessionRecord) else SessionRecord.from_result(s)
+                writer.writerow(record.csv_row())
 
         print(f"✅ Exported to {output_path}")
 
+    def export_to_columnar(self, sessions: List[Dict], output_path: str) -> List[Path]:
+        """Export sessions as typed columnar tables (Parquet, or Arrow IPC for .arrow/.feather).
 
-def main():
-    projects_dir = os.path.expanduser("~/.amplifier/projects")
+        Writes one row per session to output_path, with the patterns flattened
+        into PATTERN_COLUMNS and created as a UTC timestamp, plus a
+        <stem>_tool_usage table with one (session_id, tool, count) row per
+        exploration tool a session used. Needs pyarrow.
+        """
+        output_path = Path(output_path)
+        check_columnar_output(output_path)
+        try:
+            import pyarrow as pa
+            import pyarrow.feather as feather
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(COLUMNAR_NEEDS_PYARROW) from e
+        types = {
+            "int": pa.int64(),
+            "float": pa.float64(),
+            "bool": pa.bool_(),
+            "str": pa.string(),
+            "list": pa.list_(pa.string()),
+        }
 
-    analyzer = SessionAnalyzer(projects_dir)
+        def created_utc(value: Any) -> Optional[datetime]:
+            created = parse_timestamp(value)
+            return created.astimezone(timezone.utc) if created is not None else None
+
+        sessions_table = pa.table(
+            {
+                "session_id": pa.array([s["session_id"] for s in sessions], pa.string()),
+                "parent_session_id": pa.array([s["parent_session_id"] for s in sessions], pa.string()),
+                "created": pa.array([created_utc(s["created"]) for s in sessions], pa.timestamp("us", tz="UTC")),
+                "name": pa.array([s["name"] for s in sessions], pa.string()),
+                "description": pa.array([s["description"] for s in sessions], pa.string()),
+                "project": pa.array([s["project"] for s in sessions], pa.string()),
+                "bundle": pa.array([s["bundle"] for s in sessions], pa.string()),
+                "model": pa.array([s["model"] for s in sessions], pa.string()),
+                "turn_count": pa.array([s["turn_count"] for s in sessions], pa.int64()),
+                "message_count": pa.array([s["message_count"] for s in sessions], pa.int64()),
+                "duration_minutes": pa.array([s["duration_minutes"] for s in sessions], pa.float64()),
+                "primary_approach": pa.array([s["primary_approach"] for s in sessions], pa.string()),
+                "approaches": pa.array([s["approaches"] for s in sessions], types["list"]),
+                "success_indicators": pa.array([s["success_indicators"] for s in sessions], types["list"]),
+                **{
+                    f"{pattern}_{field}": pa.array([s["patterns"][pattern][field] for s in sessions], types[kind])
+                    for pattern, field, kind in PATTERN_COLUMNS
+                },
+            }
+        )
 
-    print("🔍 Analyzing Amplifier sessions...")
-    sessions = analyzer.analyze_all_sessions()
+        tool_rows = [
+            (s["session_id"], tool, count)
+            for s in sessions
+            for tool, count in s["patterns"]["exploration"]["tools_used"].items()
+        ]
+        tool_usage_table = pa.table(
+            {
+                "session_id": pa.array([row[0] for row in tool_rows], pa.string()),
+                "tool": pa.array([row[1] for row in tool_rows], pa.string()),
+                "count": pa.array([row[2] for row in tool_rows], pa.int64()),
+            }
+        )
 
-    print("\n📊 Generating summary statistics...")
-    summary = analyzer.generate_summary_statistics(sessions)
+        tool_usage_path = output_path.with_name(f"{output_path.stem}_tool_usage{output_path.suffix}")
+        for table, path in ((sessions_table, output_path), (tool_usage_table, tool_usage_path)):
+            if COLUMNAR_FORMATS[output_path.suffix] == "parquet":
+                pq.write_table(table, path)
+            else:
+                feather.write_feather(table, str(path))
+            print(f"✅ Exported {table.num_rows} rows to {path}")
+        return [output_path, tool_usage_path]
+
+
+class SessionCache:
+    """On-disk cache of analyze_session results.
+
+    Results are keyed on the metadata path and fingerprinted with the size and
+    mtime of both metadata.json and transcript.jsonl plus ANALYZER_VERSION, so
+    only new or modified sessions are re-analyzed. Sessions that analyze to
+    None (no metadata or messages) are cached too. Paths are stored resolved,
+    so runs from different working directories share (and don't prune) rows.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS session_results (
+                metadata_path TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                analyzer_version TEXT NOT NULL,
+                result TEXT NOT NULL
+            )
+            """
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def fingerprint(metadata_path: Path) -> str:
+        """Size/mtime signature of a session's metadata and transcript files."""
+        parts = []
+        for path in (metadata_path, metadata_path.parent / "transcript.jsonl"):
+            try:
+                stat = path.stat()
+                parts.append(f"{stat.st_size}:{stat.st_mtime_ns}")
+            except OSError:
+                parts.append("-")
+        return "|".join(parts)
+
+    @staticmethod
+    def key(metadata_path: Path) -> str:
+        return str(metadata_path.resolve())
+
+    def lookup(self, fingerprints: Dict[Path, str]) -> Dict[Path, Dict[str, Any] | None]:
+        """Return cached results for sessions whose fingerprint and analyzer version still match.
+
+        Only the rows for the given sessions are read, in batches of
+        CACHE_LOOKUP_BATCH paths, so a narrow filter doesn't load the whole cache.
+        """
+        by_key = {self.key(path): path for path in fingerprints}
+        keys = list(by_key)
+        hits = {}
+        for start in range(0, len(keys), CACHE_LOOKUP_BATCH):
+            batch = keys[start:start + CACHE_LOOKUP_BATCH]
+            rows = self.conn.execute(
+                "SELECT metadata_path, fingerprint, result FROM session_results"
+                f" WHERE analyzer_version = ? AND metadata_path IN ({', '.join('?' * len(batch))})",
+                (ANALYZER_VERSION, *batch),
+            )
+            for key, fingerprint, result in rows:
+                path = by_key[key]
+                if fingerprints[path] == fingerprint:
+                    hits[path] = json.loads(result)
+        return hits
+
+    def store(self, entries: Iterable[tuple[Path, str, Dict[str, Any] | None]]):
+        """Insert or replace results for (metadata_path, fingerprint, result) entries."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO session_results VALUES (?, ?, ?, ?)",
+                (
+                    (self.key(path), fingerprint, ANALYZER_VERSION, json.dumps(result))
+                    for path, fingerprint, result in entries
+                ),
+            )
 
-    # Export results
-    output_dir = Path.cwd()
-    analyzer.export_to_json(
-        sessions, summary, str(output_dir / "session_analysis.json")
+    def prune(self) -> int:
+        """Delete rows for sessions whose metadata.json no longer exists; return how many.
+
+        Relative keys written before paths were resolved are dropped as well.
+        """
+        stale = [
+            (key,)
+            for (key,) in self.conn.execute("SELECT metadata_path FROM session_results")
+            if not os.path.isabs(key) or not os.path.exists(key)
+        ]
+        if stale:
+            with self.conn:
+                self.conn.executemany("DELETE FROM session_results WHERE metadata_path = ?", stale)
+        return len(stale)
+
+    def close(self):
+        self.conn.close()
+
+
+def add_analysis_arguments(parser: argparse.ArgumentParser):
+    """Options for which sessions to analyze and how (shared with session_pipeline.py)."""
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for analysis (default: 1; 0 = one per CPU)",
     )
-    analyzer.export_to_csv(sessions, str(output_dir / "session_analysis.csv"))
+    parser.add_argument(
+        "--cache",
+        help=f"SQLite result cache (default: {CACHE_NAME} in the projects directory)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Re-analyze every session and skip the cache")
+    parser.add_argument(
+        "--projects-dir",
+        default="~/.amplifier/projects",
+        help="Amplifier projects directory (default: ~/.amplifier/projects)",
+    )
+    window = parser.add_mutually_exclusive_group()
+    window.add_argument(
+        "--days",
+        type=int,
+        help="Only analyze sessions created in the last N days (older session directories are not read)",
+    )
+    window.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        help="Only analyze sessions created at or after this ISO date/time (local time unless an offset is given)",
+    )
+    parser.add_argument(
+        "--until", type=datetime.fromisoformat, help="Only analyze sessions created before this ISO date/time"
+    )
+    parser.add_argument(
+        "--project", action="append", default=[], help="Only projects whose directory name contains this (repeatable)"
+    )
+    parser.add_argument(
+        "--bundle", action="append", default=[], help="Only sessions whose bundle contains this (repeatable)"
+    )
+    parser.add_argument(
+        "--model", action="append", default=[], help="Only sessions whose model contains this (repeatable)"
+    )
+    parser.add_argument(
+        "--json-backend",
+        choices=JSON_BACKENDS,
+        default="auto",
+        help="JSON decoder (default: msgspec, then orjson, then stdlib json, whichever is installed)",
+    )
+
+
+def analyzer_from_args(args: argparse.Namespace) -> tuple[SessionAnalyzer, SessionFilter]:
+    """The analyzer and session filter selected by add_analysis_arguments() options."""
+    since = datetime.now(timezone.utc) - timedelta(days=args.days) if args.days is not None else args.since
+    session_filter = SessionFilter(
+        since=since,
+        until=args.until,
+        projects=tuple(args.project),
+        bundles=tuple(args.bundle),
+        models=tuple(args.model),
+    )
+    return SessionAnalyzer(os.path.expanduser(args.projects_dir), json_backend=args.json_backend), session_filter
+
+
+def analyze_from_args(
+    analyzer: SessionAnalyzer,
+    session_filter: SessionFilter,
+    args: argparse.Namespace,
+    as_record: Optional[Callable[[Dict[str, Any]], Any]] = None,
+) -> List[Any]:
+    """Run analyze_all_sessions with the -j/--cache/--no-cache options."""
+    workers = args.workers or os.cpu_count() or 1
+    cache = None
+    if not args.no_cache:
+        if not analyzer.projects_dir.is_dir():
+            # Nothing to find; don't leave a cache (and a directory tree) behind a mistyped path
+            print(f"Projects directory {analyzer.projects_dir} not found; not caching")
+        else:
+            cache_path = Path(args.cache) if args.cache else analyzer.projects_dir / CACHE_NAME
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache = SessionCache(cache_path)
+
+    print("🔍 Analyzing Amplifier sessions...")
+    try:
+        return analyzer.analyze_all_sessions(
+            workers=workers, cache=cache, session_filter=session_filter, as_record=as_record
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+
 
-    # Print summary
+def print_summary(summary: Dict[str, Any]):
+    """Print SummaryAggregator.result() statistics."""
     print("\n" + "=" * 60)
     print("SUMMARY STATISTICS")
     print("=" * 60)
@@ -543,6 +1538,55 @@ def main():
         print(f"  {pattern}: {count} ({pct:.1f}%)")
 
     print("\n" + "=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze Amplifier sessions for problem-solving patterns.")
+    add_analysis_arguments(parser)
+    parser.add_argument(
+        "--columnar",
+        metavar="PATH",
+        help="Also export typed sessions and <stem>_tool_usage tables (.parquet, or .arrow/.feather; needs pyarrow)",
+    )
+    parser.add_argument(
+        "--verify-detectors",
+        action="store_true",
+        help="Check the single-pass detector against the per-detector functions on every session, then exit",
+    )
+    args = parser.parse_args()
+    if args.columnar:
+        # Fail now rather than after the analysis and the JSON/CSV exports
+        try:
+            check_columnar_output(args.columnar)
+        except (ValueError, ImportError) as e:
+            parser.error(str(e))
+    analyzer, session_filter = analyzer_from_args(args)
+
+    if args.verify_detectors:
+        mismatches = analyzer.verify_pattern_detector(session_filter)
+        for path in mismatches:
+            print(f"❌ Detector mismatch: {path}")
+        print(f"{'❌' if mismatches else '✅'} {len(mismatches)} mismatching sessions")
+        raise SystemExit(1 if mismatches else 0)
+
+    sessions = analyze_from_args(analyzer, session_filter, args)
+    if not sessions:
+        print("No sessions matched; nothing to export.")
+        return
+
+    print("\n📊 Generating summary statistics...")
+    summary = analyzer.last_run_summary.result()
+
+    # Export results
+    output_dir = Path.cwd()
+    analyzer.export_to_json(
+        sessions, summary, str(output_dir / "session_analysis.json")
+    )
+    analyzer.export_to_csv(sessions, str(output_dir / "session_analysis.csv"))
+    if args.columnar:
+        analyzer.export_to_columnar(sessions, args.columnar)
+
+    print_summary(summary)
     print("✨ Analysis complete!")
 
 
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+bench_html2pptx.py - Benchmark html2pptx over the real deck corpus.
+
+Runs HTMLToPPTXConverter over every deck in docs/, staging/ and presentations/
+(or the paths given) and records, per deck and in aggregate:
+- parse time (building the document tree / pulling slides off the stream)
+- layout time (process_slide)
+- save time (serializing the .pptx)
+- peak RSS of the worker process
+- slides and shapes generated
+
+Each deck runs in a fresh worker process so peak RSS is attributable to that
+deck. Results are written as JSON; pass --compare with an earlier result file
+to flag regressions beyond --threshold.
+
+Usage:
+    uv run --with python-pptx,beautifulsoup4,lxml python tools/bench_html2pptx.py [paths...] [-o bench.json]
+    uv run --with python-pptx,beautifulsoup4,lxml python tools/bench_html2pptx.py --compare baseline.json -o new.json
+"""
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from html2pptx import (
+    CONVERTER_VERSION,
+    DEFAULT_ENGINE,
+    DEFAULT_TEXT_MODE,
+    ENGINES,
+    TEXT_MODES,
+    HTMLToPPTXConverter,
+    resolve_inputs,
+)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CORPUS = [REPO_ROOT / "docs", REPO_ROOT / "staging", REPO_ROOT / "presentations"]
+
+# Metrics compared by --compare; lower is better for all of them
+COMPARED_METRICS = ["parse_seconds", "layout_seconds", "save_seconds", "total_seconds", "peak_rss_mb", "shapes"]
+TIME_METRICS = {"parse_seconds", "layout_seconds", "save_seconds", "total_seconds"}
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of the current process in MB (0 if unavailable)."""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def bench_deck(path: str, engine: str = DEFAULT_ENGINE, repeat: int = 1, text_mode: str = DEFAULT_TEXT_MODE) -> dict:
+    """Convert one deck `repeat` times and return the median phase timings."""
+    html_content = Path(path).read_text(encoding="utf-8")
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        converter = HTMLToPPTXConverter(html_content, engine=engine, text_mode=text_mode)
+        parse = time.perf_counter() - start
+        layout = 0.0
+
+        slides = converter.extract_slides()
+        slide_num = 0
+        while True:
+            start = time.perf_counter()
+            slide_div = next(slides, None)
+            parse += time.perf_counter() - start
+            if slide_div is None:
+                break
+            slide_num += 1
+            start = time.perf_counter()
+            converter.process_slide(slide_div, slide_num)
+            layout += time.perf_counter() - start
+
+        start = time.perf_counter()
+        buffer = io.BytesIO()
+        converter.prs.save(buffer)
+        save = time.perf_counter() - start
+
+        runs.append((parse, layout, save))
+
+    parse, layout, save = (statistics.median(phase) for phase in zip(*runs))
+    return {
+        "parse_seconds": round(parse, 5),
+        "layout_seconds": round(layout, 5),
+        "save_seconds": round(save, 5),
+        "total_seconds": round(parse + layout + save, 5),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "slides": len(converter.prs.slides),
+        "shapes": sum(len(slide.shapes) for slide in converter.prs.slides),
+        "output_bytes": buffer.tell(),
+    }
+
+
+def aggregate(decks: dict[str, dict]) -> dict:
+    """Totals across decks (peak RSS is the maximum, not the sum)."""
+    if not decks:
+        return {}
+    totals = {
+        key: round(sum(d[key] for d in decks.values()), 5)
+        for key in [
+            "parse_seconds", "layout_seconds", "save_seconds", "total_seconds", "slides", "shapes", "output_bytes"
+        ]
+    }
+    totals["peak_rss_mb"] = max(d["peak_rss_mb"] for d in decks.values())
+    totals["decks"] = len(decks)
+    return totals
+
+
+def compare(baseline: dict, current: dict, threshold: float, min_delta_ms: float) -> list[str]:
+    """Return human-readable regression lines for metrics that grew by more than threshold."""
+    regressions = []
+
+    def check(label: str, old: dict, new: dict):
+        for metric in COMPARED_METRICS:
+            if metric not in old or metric not in new:
+                continue
+            before, after = old[metric], new[metric]
+            if metric in TIME_METRICS and (after - before) * 1000 < min_delta_ms:
+                continue
+            if after > before * (1 + threshold):
+                change = (after / before - 1) * 100 if before else float("inf")
+                regressions.append(f"{label}: {metric} {before} -> {after} (+{change:.1f}%)")
+
+    # Aggregates are only comparable over the same set of decks
+    if set(baseline.get("decks", {})) == set(current["decks"]):
+        check("aggregate", baseline.get("aggregate", {}), current["aggregate"])
+    for deck, new in current["decks"].items():
+        old = baseline.get("decks", {}).get(deck)
+        if old:
+            check(deck, old, new)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark html2pptx over the Amplifier Stories deck corpus.")
+    parser.add_argument(
+        "paths", nargs="*", help="Decks, directories or globs (default: docs/, staging/, presentations/)"
+    )
+    parser.add_argument("-o", "--output", help="Write results JSON here (default: print summary only)")
+    parser.add_argument("--engine", choices=ENGINES, default=DEFAULT_ENGINE, help="Parse engine to benchmark")
+    parser.add_argument("--text-mode", choices=TEXT_MODES, default=DEFAULT_TEXT_MODE, help="Text emission mode")
+    parser.add_argument("--repeat", type=int, default=1, help="Conversions per deck; timings are the median")
+    parser.add_argument("--compare", help="Baseline results JSON to check for regressions")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="Relative growth flagged as a regression (default: 0.10)"
+    )
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=5.0, help="Ignore timing changes smaller than this (default: 5ms)"
+    )
+    args = parser.parse_args()
+
+    paths = resolve_inputs(args.paths or [str(p) for p in DEFAULT_CORPUS if p.exists()])
+    if not paths:
+        print("Error: No decks found", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"Benchmarking {len(paths)} decks "
+        f"(engine={args.engine}, text_mode={args.text_mode}, repeat={args.repeat})..."
+    )
+    decks = {}
+    failed = 0
+    # One task per fresh worker so ru_maxrss reflects a single deck
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as pool:
+        futures = {pool.submit(bench_deck, str(p), args.engine, args.repeat, args.text_mode): p for p in paths}
+        for future, path in futures.items():
+            resolved = path.resolve()
+            key = resolved.relative_to(REPO_ROOT).as_posix() if resolved.is_relative_to(REPO_ROOT) else str(path)
+            try:
+                decks[key] = result = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"  ✗ {key}: {type(e).__name__}: {e}", file=sys.stderr)
+                continue
+            print(
+                f"  {key}: {result['total_seconds'] * 1000:.0f}ms "
+                f"(parse {result['parse_seconds'] * 1000:.0f}, layout {result['layout_seconds'] * 1000:.0f}, "
+                f"save {result['save_seconds'] * 1000:.0f}) {result['shapes']} shapes, {result['peak_rss_mb']} MB"
+            )
+
+    results = {
+        "generated_at": datetime.now().isoformat(),
+        "converter_version": CONVERTER_VERSION,
+        "engine": args.engine,
+        "text_mode": args.text_mode,
+        "repeat": args.repeat,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "aggregate": aggregate(decks),
+        "decks": decks,
+    }
+
+    totals = results["aggregate"]
+    print(
+        f"\nTotal: {totals.get('total_seconds', 0):.2f}s over {totals.get('decks', 0)} decks "
+        f"(parse {totals.get('parse_seconds', 0):.2f}s, layout {totals.get('layout_seconds', 0):.2f}s, "
+        f"save {totals.get('save_seconds', 0):.2f}s), {totals.get('shapes', 0)} shapes, "
+        f"peak RSS {totals.get('peak_rss_mb', 0)} MB"
+    )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare(baseline, results, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) vs {args.compare}:")
+            for line in regressions:
+                print(f"  ✗ {line}")
+            sys.exit(1)
+        print(f"\nNo regressions vs {args.compare} (threshold {args.threshold:.0%})")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
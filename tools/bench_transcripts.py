@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+bench_transcripts.py - Benchmark analyze_sessions JSON backends on a synthetic corpus.
+
+Generates a deterministic corpus of Amplifier-style sessions (metadata.json plus
+transcript.jsonl, with a share of large tool outputs like real file reads and
+command logs), then times SessionAnalyzer.analyze_session over it with every
+installed JSON backend. Results are checked against the stdlib backend so a
+faster decoder can't silently change the analysis.
+
+Usage:
+    python tools/bench_transcripts.py [--sessions 200] [--repeat 3] [-o bench.json]
+    uv run --with orjson,msgspec python tools/bench_transcripts.py --keep-corpus /tmp/corpus
+"""
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from analyze_sessions import ANALYZER_VERSION, JSON_BACKENDS, SessionAnalyzer, get_decoder
+
+TOOLS = ["read_file", "grep", "glob", "bash", "edit_file", "write_file", "web_search", "task", "python_check"]
+USER_PROMPTS = [
+    "Can you fix the failing test in the parser?",
+    "Use zen-architect agent to review the design",
+    "Please improve the error handling here",
+    "Revise the summary and update the README",
+    "What does this module do?",
+]
+TOOL_RESULTS = ["ok", "Error: file not found", "Command failed with exit code 1", "3 files changed"]
+
+
+def generate_corpus(root: Path, sessions: int, seed: int = 0) -> Path:
+    """Write `sessions` synthetic sessions under root/projects and return the projects dir."""
+    rng = random.Random(seed)
+    projects_dir = root / "projects"
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    # Tool output is mostly ASCII with the odd box-drawing/check-mark/accented character
+    filler = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz \n" * 40 + "─✓é") for _ in range(4096))
+
+    for i in range(sessions):
+        session_dir = projects_dir / f"project-{i % 8}" / "sessions" / f"session-{i:05d}"
+        session_dir.mkdir(parents=True, exist_ok=True)
+        created = start + timedelta(hours=i)
+        metadata = {
+            "session_id": f"session-{i:05d}",
+            "created": created.isoformat(),
+            "name": f"Synthetic session {i}",
+            "description": "Benchmark session",
+            "bundle": rng.choice(["foundation", "stories", "developer"]),
+            "model": rng.choice(["claude-sonnet", "claude-opus", "gpt-5"]),
+            "turn_count": rng.randint(1, 40),
+        }
+        (session_dir / "metadata.json").write_text(json.dumps(metadata), encoding="utf-8")
+
+        timestamp = created
+        with open(session_dir / "transcript.jsonl", "w", encoding="utf-8") as f:
+            for _ in range(rng.randint(20, 120)):
+                timestamp += timedelta(seconds=rng.randint(1, 90))
+                roll = rng.random()
+                if roll < 0.2:
+                    message = {"role": "user", "content": rng.choice(USER_PROMPTS)}
+                elif roll < 0.55:
+                    calls = [
+                        {
+                            "id": f"call_{rng.getrandbits(32):08x}",
+                            "tool": rng.choice(TOOLS),
+                            "arguments": {"path": "src/app.py"},
+                        }
+                        for _ in range(rng.randint(0, 3))
+                    ]
+                    message = {
+                        "role": "assistant",
+                        "content": [
+                            {"type": "thinking", "thinking": "Let me look."},
+                            {"type": "text", "text": "Working on it."},
+                        ],
+                        "tool_calls": calls,
+                        "usage": {"input_tokens": rng.randint(100, 90000), "output_tokens": rng.randint(10, 4000)},
+                    }
+                else:
+                    # Roughly a third of tool results are large outputs (file reads, logs)
+                    large = rng.random() < 0.3
+                    content = filler * rng.randint(2, 32) if large else rng.choice(TOOL_RESULTS)
+                    message = {"role": "tool", "tool_call_id": f"call_{rng.getrandbits(32):08x}", "content": content}
+                message["timestamp"] = timestamp.isoformat()
+                f.write(json.dumps(message) + "\n")
+
+    return projects_dir
+
+
+def bench_backend(analyzer: SessionAnalyzer, metadata_paths: list[Path], repeat: int) -> tuple[float, list]:
+    """Analyze every session `repeat` times; return the median seconds and the results."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [analyzer.analyze_session(path) for path in metadata_paths]
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), results
+
+
+def available_backends() -> list[str]:
+    """Installed backends, stdlib json first so it is the reference for results and speedup."""
+    backends = []
+    for backend in sorted((b for b in JSON_BACKENDS if b != "auto"), key=lambda b: b != "json"):
+        try:
+            get_decoder(backend)
+        except ValueError:
+            continue
+        backends.append(backend)
+    return backends
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark analyze_sessions JSON backends on a synthetic corpus.")
+    parser.add_argument("--sessions", type=int, default=200, help="Sessions to generate (default: 200)")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes per backend; timings are the median")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed")
+    parser.add_argument("--keep-corpus", help="Generate the corpus here and keep it (default: temp dir, removed)")
+    parser.add_argument("-o", "--output", help="Write results JSON here (default: print summary only)")
+    args = parser.parse_args()
+
+    root = Path(args.keep_corpus) if args.keep_corpus else Path(tempfile.mkdtemp(prefix="bench-transcripts-"))
+    try:
+        projects_dir = generate_corpus(root, args.sessions, args.seed)
+        analyzer = SessionAnalyzer(str(projects_dir), json_backend="json")
+        metadata_paths = analyzer.find_all_sessions()
+        corpus_bytes = sum(SessionAnalyzer.session_bytes(path) for path in metadata_paths)
+        corpus_mb = corpus_bytes / (1024 * 1024)
+        print(f"Corpus: {len(metadata_paths)} sessions, {corpus_mb:.1f} MB in {projects_dir}")
+
+        backends = {}
+        reference = None
+        mismatched = []
+        for backend in available_backends():
+            seconds, results = bench_backend(
+                SessionAnalyzer(str(projects_dir), json_backend=backend), metadata_paths, args.repeat
+            )
+            if reference is None:
+                reference = results
+            elif results != reference:
+                mismatched.append(backend)
+            backends[backend] = {
+                "seconds": round(seconds, 4),
+                "mb_per_second": round(corpus_mb / seconds, 1) if seconds else 0.0,
+                "speedup": round(backends["json"]["seconds"] / seconds, 2) if backends and seconds else 1.0,
+            }
+            result = backends[backend]
+            print(
+                f"  {backend:8} {result['seconds'] * 1000:8.0f}ms  {result['mb_per_second']:7.1f} MB/s  "
+                f"{result['speedup']:.2f}x"
+            )
+
+        missing = [b for b in JSON_BACKENDS if b != "auto" and b not in backends]
+        if missing:
+            print(f"Not installed: {', '.join(missing)}")
+    finally:
+        if not args.keep_corpus:
+            shutil.rmtree(root, ignore_errors=True)
+
+    if args.output:
+        results = {
+            "generated_at": datetime.now().isoformat(),
+            "analyzer_version": ANALYZER_VERSION,
+            "sessions": len(metadata_paths),
+            "corpus_bytes": corpus_bytes,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backends": backends,
+        }
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+    if mismatched:
+        print(f"Error: Results differ from stdlib json for: {', '.join(mismatched)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,299 +1,328 @@
 #!/usr/bin/env python3
-"""Create Excel dashboard from session analysis data."""
+"""
+create_dashboard.py - Create an Excel dashboard from session analysis data.
 
-import csv
-from collections import Counter, defaultdict
-from datetime import datetime
-from pathlib import Path
-
-try:
-    from openpyxl import Workbook
-    from openpyxl.chart import BarChart, PieChart, Reference
-    from openpyxl.styles import Font, PatternFill
-except ImportError:
-    print("Installing openpyxl...")
-    import subprocess
-
-    subprocess.check_call(["pip", "install", "openpyxl"])
-    from openpyxl import Workbook
-    from openpyxl.chart import BarChart, PieChart, Reference
-    from openpyxl.styles import Font, PatternFill
-
-# Read the CSV data
-csv_path = Path("session_analysis.csv")
-sessions = []
-with open(csv_path, "r") as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        sessions.append(row)
-
-# Create workbook
-wb = Workbook()
-if wb.active:
-    wb.remove(wb.active)  # Remove default sheet
-
-# ===== SHEET 1: Summary Dashboard =====
-ws_summary = wb.create_sheet("Dashboard", 0)
-
-# Title
-ws_summary["A1"] = "Amplifier Problem-Solving Approaches Dashboard"
-ws_summary["A1"].font = Font(size=18, bold=True, color="FFFFFF")
-ws_summary["A1"].fill = PatternFill(
-    start_color="4472C4", end_color="4472C4", fill_type="solid"
-)
-ws_summary.merge_cells("A1:F1")
-ws_summary.row_dimensions[1].height = 30
-
-# Metadata
-ws_summary["A3"] = "Analysis Date:"
-ws_summary["B3"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-ws_summary["A4"] = "Total Sessions:"
-ws_summary["B4"] = len(sessions)
-ws_summary["A5"] = "Date Range:"
-dates = [s["Created"] for s in sessions if s["Created"]]
-if dates:
-    ws_summary["B5"] = f"{min(dates)[:10]} to {max(dates)[:10]}"
-
-# Count approaches
-approach_counter = Counter()
-for session in sessions:
-    approaches = session.get("All Approaches", "")
-    if approaches:
-        for approach in approaches.split(", "):
-            approach_counter[approach.strip()] += 1
-
-# ===== SHEET 2: Approach Frequency Data =====
-ws_freq = wb.create_sheet("Approach Frequency")
-
-# Headers
-ws_freq["A1"] = "Problem-Solving Approach"
-ws_freq["B1"] = "Count"
-ws_freq["C1"] = "Percentage"
-for cell in ["A1", "B1", "C1"]:
-    ws_freq[cell].font = Font(bold=True)
-    ws_freq[cell].fill = PatternFill(
-        start_color="D9E1F2", end_color="D9E1F2", fill_type="solid"
-    )
+The dashboard can be built from the CSV written by analyze_sessions.py, or
+straight from SessionAnalyzer results in the same process, which skips the
+CSV round-trip (writing, re-parsing and re-splitting the ", "-joined columns):
 
-# Data
-row = 2
-total_sessions = len(sessions)
-for approach, count in approach_counter.most_common():
-    ws_freq[f"A{row}"] = approach
-    ws_freq[f"B{row}"] = count
-    ws_freq[f"C{row}"] = f"{(count / total_sessions) * 100:.1f}%"
-    row += 1
-
-# Adjust column widths
-ws_freq.column_dimensions["A"].width = 35
-ws_freq.column_dimensions["B"].width = 12
-ws_freq.column_dimensions["C"].width = 12
-
-# Add bar chart to summary
-chart = BarChart()
-chart.title = "Problem-Solving Approach Frequency"
-chart.x_axis.title = "Approach"
-chart.y_axis.title = "Number of Sessions"
-data = Reference(ws_freq, min_col=2, min_row=1, max_row=row - 1)
-cats = Reference(ws_freq, min_col=1, min_row=2, max_row=row - 1)
-chart.add_data(data, titles_from_data=True)
-chart.set_categories(cats)
-chart.height = 12
-chart.width = 20
-ws_summary.add_chart(chart, "A8")
-
-# ===== SHEET 3: Primary Approach Distribution =====
-ws_primary = wb.create_sheet("Primary Approach")
-
-# Count primary approaches
-primary_counter = Counter()
-for session in sessions:
-    primary = session.get("Primary Approach", "Unknown")
-    if primary:
-        primary_counter[primary] += 1
-
-# Headers
-ws_primary["A1"] = "Primary Approach"
-ws_primary["B1"] = "Count"
-for cell in ["A1", "B1"]:
-    ws_primary[cell].font = Font(bold=True)
-    ws_primary[cell].fill = PatternFill(
-        start_color="D9E1F2", end_color="D9E1F2", fill_type="solid"
-    )
-
-# Data
-row = 2
-for approach, count in primary_counter.most_common():
-    ws_primary[f"A{row}"] = approach
-    ws_primary[f"B{row}"] = count
-    row += 1
-
-ws_primary.column_dimensions["A"].width = 35
-ws_primary.column_dimensions["B"].width = 12
-
-# Add pie chart to summary
-pie = PieChart()
-pie.title = "Primary Approach Distribution"
-data = Reference(ws_primary, min_col=2, min_row=1, max_row=row - 1)
-cats = Reference(ws_primary, min_col=1, min_row=2, max_row=row - 1)
-pie.add_data(data, titles_from_data=True)
-pie.set_categories(cats)
-pie.height = 12
-pie.width = 20
-ws_summary.add_chart(pie, "K8")
-
-# ===== SHEET 4: Time-based Analysis =====
-ws_time = wb.create_sheet("Timeline")
-
-# Group by date
-sessions_by_date = defaultdict(list)
-for session in sessions:
-    if session.get("Created"):
-        date = session["Created"][:10]
-        sessions_by_date[date].append(session)
-
-# Headers
-ws_time["A1"] = "Date"
-ws_time["B1"] = "Total Sessions"
-ws_time["C1"] = "Exploratory"
-ws_time["D1"] = "Error Recovery"
-ws_time["E1"] = "Validation"
-ws_time["F1"] = "Direct Implementation"
-for cell in ["A1", "B1", "C1", "D1", "E1", "F1"]:
-    ws_time[cell].font = Font(bold=True)
-    ws_time[cell].fill = PatternFill(
-        start_color="D9E1F2", end_color="D9E1F2", fill_type="solid"
-    )
+    from analyze_sessions import SessionAnalyzer
+    from create_dashboard import build_dashboard
 
-# Data
-row = 2
-for date in sorted(sessions_by_date.keys()):
-    day_sessions = sessions_by_date[date]
-    ws_time[f"A{row}"] = date
-    ws_time[f"B{row}"] = len(day_sessions)
+    sessions = SessionAnalyzer(projects_dir).analyze_all_sessions()
+    build_dashboard(sessions, "dashboard.xlsx")
 
-    # Count specific approaches
-    exploratory = sum(
-        1 for s in day_sessions if "Exploratory" in s.get("All Approaches", "")
-    )
-    error_recovery = sum(
-        1 for s in day_sessions if "Error Recovery" in s.get("All Approaches", "")
-    )
-    validation = sum(
-        1 for s in day_sessions if "Validation" in s.get("All Approaches", "")
-    )
-    direct = sum(
-        1
-        for s in day_sessions
-        if "Direct Implementation" in s.get("All Approaches", "")
-    )
+Usage:
+    uv run --with openpyxl,pandas python tools/create_dashboard.py [session_analysis.csv] [output.xlsx]
+"""
 
-    ws_time[f"C{row}"] = exploratory
-    ws_time[f"D{row}"] = error_recovery
-    ws_time[f"E{row}"] = validation
-    ws_time[f"F{row}"] = direct
-    row += 1
-
-for col in ["A", "B", "C", "D", "E", "F"]:
-    ws_time.column_dimensions[col].width = 15
-
-# ===== SHEET 5: Success Patterns =====
-ws_success = wb.create_sheet("Success Patterns")
-
-ws_success["A1"] = "Pattern Analysis"
-ws_success["A1"].font = Font(size=14, bold=True)
-ws_success.merge_cells("A1:C1")
-
-row = 3
-ws_success[f"A{row}"] = "Metric"
-ws_success[f"B{row}"] = "Value"
-ws_success[f"C{row}"] = "Notes"
-for cell in [f"A{row}", f"B{row}", f"C{row}"]:
-    ws_success[cell].font = Font(bold=True)
-    ws_success[cell].fill = PatternFill(
-        start_color="D9E1F2", end_color="D9E1F2", fill_type="solid"
+import argparse
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Union
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.chart import BarChart, PieChart, Reference
+from openpyxl.styles import Font, NamedStyle, PatternFill
+
+from analyze_sessions import CSV_COLUMNS, SessionRecord
+
+DEFAULT_INPUT = Path("session_analysis.csv")
+DEFAULT_OUTPUT = Path.home() / "Downloads" / "amplifier-sessions-problem-solving-dashboard.xlsx"
+
+# Timeline columns: header -> approach name from analyze_sessions.categorize_approach
+TIMELINE_APPROACHES = {
+    "Exploratory": "Exploratory Investigation",
+    "Error Recovery": "Error Recovery & Resilience",
+    "Validation": "Validation-Driven",
+    "Direct Implementation": "Direct Implementation",
+}
+
+
+def split_multi(column: pd.Series) -> pd.DataFrame:
+    """One 0/1 column per distinct value of a ", "-joined multi-valued column."""
+    return column.str.get_dummies(sep=", ")
+
+
+def flag_frame(values: List[Iterable[str]]) -> pd.DataFrame:
+    """One 0/1 column per distinct value across per-session lists (split_multi for lists)."""
+    return pd.DataFrame([dict.fromkeys(items, 1) for items in values]).fillna(0).astype(int)
+
+
+def ranked_counts(values: pd.Series) -> pd.Series:
+    """Value counts, most common first; ties keep first-seen order like Counter.most_common()."""
+    return values.value_counts(sort=False).sort_values(ascending=False, kind="stable")
+
+
+@dataclass
+class DashboardData:
+    """The per-session columns the dashboard aggregates, plus the Raw Data table.
+
+    approaches has one entry per (session, approach) in session order;
+    approach_flags and success_flags have one 0/1 column per distinct value.
+    """
+
+    created: pd.Series
+    primary_approach: pd.Series
+    approaches: pd.Series
+    approach_flags: pd.DataFrame
+    success_flags: pd.DataFrame
+    turn_count: pd.Series
+    message_count: pd.Series
+    raw: pd.DataFrame
+
+    def __len__(self) -> int:
+        return len(self.created)
+
+    @classmethod
+    def from_csv(cls, csv_path: Union[str, Path]) -> "DashboardData":
+        """Load the session CSV written by analyze_sessions.py (values are kept as text)."""
+        sessions = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+        approaches = sessions["All Approaches"].str.split(", ").explode().str.strip()
+        return cls(
+            created=sessions["Created"],
+            primary_approach=sessions["Primary Approach"],
+            approaches=approaches[approaches != ""],
+            approach_flags=split_multi(sessions["All Approaches"]),
+            success_flags=split_multi(sessions["Success Indicators"]),
+            turn_count=pd.to_numeric(sessions["Turn Count"].replace("", "0")),
+            message_count=pd.to_numeric(sessions["Message Count"].replace("", "0")),
+            raw=sessions,
+        )
+
+    @classmethod
+    def from_sessions(cls, sessions: List[Union[Dict[str, Any], SessionRecord]]) -> "DashboardData":
+        """Use SessionAnalyzer results (result dicts or SessionRecords) directly, keeping list fields as lists."""
+        records = [s if isinstance(s, SessionRecord) else SessionRecord.from_result(s) for s in sessions]
+        return cls(
+            created=pd.Series([r.created or "" for r in records], dtype=str),
+            primary_approach=pd.Series([r.primary_approach for r in records], dtype=str),
+            approaches=pd.Series([approach for r in records for approach in r.approaches], dtype=str),
+            approach_flags=flag_frame([r.approaches for r in records]),
+            success_flags=flag_frame([r.success_indicators for r in records]),
+            turn_count=pd.Series([r.turn_count or 0 for r in records], dtype=float),
+            message_count=pd.Series([r.message_count for r in records], dtype=float),
+            raw=pd.DataFrame([r.csv_row() for r in records], columns=CSV_COLUMNS),
+        )
+
+
+def add_named_styles(wb: Workbook):
+    """Register the dashboard's cell styles once; styled cells share them by name."""
+    header_fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+    title_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    for style in [
+        NamedStyle("Dashboard Title", font=Font(size=18, bold=True, color="FFFFFF"), fill=title_fill),
+        NamedStyle("Section Title", font=Font(size=14, bold=True)),
+        NamedStyle("Section Label", font=Font(bold=True)),
+        NamedStyle("Table Header", font=Font(bold=True), fill=header_fill),
+    ]:
+        wb.add_named_style(style)
+
+
+def styled(ws, value, style: str):
+    """A cell for ws.append() carrying one of the shared named styles."""
+    cell = WriteOnlyCell(ws, value)
+    cell.style = style
+    return cell
+
+
+def header_row(ws, headers: list[str]) -> list:
+    """A row of "Table Header" cells."""
+    return [styled(ws, header, "Table Header") for header in headers]
+
+
+def build_dashboard(
+    data: Union[DashboardData, List[Dict[str, Any]], List[SessionRecord]], output: Union[str, Path]
+) -> Path:
+    """Write the dashboard workbook to output and return its path.
+
+    data is either SessionAnalyzer results (the list from analyze_all_sessions,
+    as result dicts or SessionRecords) or a DashboardData, e.g.
+    DashboardData.from_csv("session_analysis.csv").
+    """
+    if not isinstance(data, DashboardData):
+        data = DashboardData.from_sessions(data)
+    total_sessions = len(data)
+    if not total_sessions:
+        raise ValueError("No sessions to build a dashboard from")
+
+    dated = data.created != ""
+    created_dates = data.created.str[:10]
+
+    # Create a write-only workbook: every sheet streams its rows to disk as they are
+    # appended, so memory stays flat however many sessions the Raw Data sheet holds.
+    # Write-only sheets are laid out front to back: dimensions, merges and freeze
+    # panes are set before the first row, and cells are styled as they are created.
+    wb = Workbook(write_only=True)
+    add_named_styles(wb)
+
+    # Count approaches
+    approach_counts = ranked_counts(data.approaches)
+
+    # Count primary approaches
+    primary = data.primary_approach
+    primary_counts = ranked_counts(primary[primary != ""])
+
+    # ===== SHEET 1: Summary Dashboard =====
+    ws_summary = wb.create_sheet("Dashboard")
+
+    ws_summary.merged_cells.add("A1:F1")
+    ws_summary.row_dimensions[1].height = 30
+
+    # Title
+    ws_summary.append([styled(ws_summary, "Amplifier Problem-Solving Approaches Dashboard", "Dashboard Title")])
+    ws_summary.append([])
+
+    # Metadata
+    ws_summary.append(["Analysis Date:", datetime.now().strftime("%Y-%m-%d %H:%M")])
+    ws_summary.append(["Total Sessions:", total_sessions])
+    if dated.any():
+        dates = data.created[dated]
+        ws_summary.append(["Date Range:", f"{dates.min()[:10]} to {dates.max()[:10]}"])
+    else:
+        ws_summary.append(["Date Range:"])
+
+    # ===== SHEET 2: Approach Frequency Data =====
+    ws_freq = wb.create_sheet("Approach Frequency")
+
+    ws_freq.column_dimensions["A"].width = 35
+    ws_freq.column_dimensions["B"].width = 12
+    ws_freq.column_dimensions["C"].width = 12
+
+    ws_freq.append(header_row(ws_freq, ["Problem-Solving Approach", "Count", "Percentage"]))
+    for approach, count in approach_counts.items():
+        ws_freq.append([approach, int(count), f"{(count / total_sessions) * 100:.1f}%"])
+
+    # Add bar chart to summary
+    last_row = len(approach_counts) + 1
+    chart = BarChart()
+    chart.title = "Problem-Solving Approach Frequency"
+    chart.x_axis.title = "Approach"
+    chart.y_axis.title = "Number of Sessions"
+    chart_data = Reference(ws_freq, min_col=2, min_row=1, max_row=last_row)
+    cats = Reference(ws_freq, min_col=1, min_row=2, max_row=last_row)
+    chart.add_data(chart_data, titles_from_data=True)
+    chart.set_categories(cats)
+    chart.height = 12
+    chart.width = 20
+    ws_summary.add_chart(chart, "A8")
+
+    # ===== SHEET 3: Primary Approach Distribution =====
+    ws_primary = wb.create_sheet("Primary Approach")
+
+    ws_primary.column_dimensions["A"].width = 35
+    ws_primary.column_dimensions["B"].width = 12
+
+    ws_primary.append(header_row(ws_primary, ["Primary Approach", "Count"]))
+    for approach, count in primary_counts.items():
+        ws_primary.append([approach, int(count)])
+
+    # Add pie chart to summary
+    last_row = len(primary_counts) + 1
+    pie = PieChart()
+    pie.title = "Primary Approach Distribution"
+    chart_data = Reference(ws_primary, min_col=2, min_row=1, max_row=last_row)
+    cats = Reference(ws_primary, min_col=1, min_row=2, max_row=last_row)
+    pie.add_data(chart_data, titles_from_data=True)
+    pie.set_categories(cats)
+    pie.height = 12
+    pie.width = 20
+    ws_summary.add_chart(pie, "K8")
+
+    # ===== SHEET 4: Time-based Analysis =====
+    ws_time = wb.create_sheet("Timeline")
+
+    # Group by date: sessions per day plus, per tracked approach, sessions that used it
+    timeline = (
+        data.approach_flags.reindex(columns=list(TIMELINE_APPROACHES.values()), fill_value=0)[dated]
+        .groupby(created_dates[dated])
+        .sum()
     )
-
-row += 1
-# Sessions with file modifications
-file_mod = sum(
-    1 for s in sessions if "Files Modified" in s.get("Success Indicators", "")
-)
-ws_success[f"A{row}"] = "Sessions with File Modifications"
-ws_success[f"B{row}"] = file_mod
-ws_success[f"C{row}"] = f"{(file_mod / total_sessions) * 100:.1f}%"
-
-row += 1
-# Sessions with validation
-validated = sum(1 for s in sessions if "Validated" in s.get("Success Indicators", ""))
-ws_success[f"A{row}"] = "Sessions with Validation"
-ws_success[f"B{row}"] = validated
-ws_success[f"C{row}"] = f"{(validated / total_sessions) * 100:.1f}%"
-
-row += 1
-# Sessions with good error recovery
-error_rec = sum(
-    1 for s in sessions if "Good Error Recovery" in s.get("Success Indicators", "")
-)
-ws_success[f"A{row}"] = "Sessions with Good Error Recovery"
-ws_success[f"B{row}"] = error_rec
-ws_success[f"C{row}"] = f"{(error_rec / total_sessions) * 100:.1f}%"
-
-row += 1
-# Substantial work sessions
-substantial = sum(
-    1 for s in sessions if "Substantial Work" in s.get("Success Indicators", "")
-)
-ws_success[f"A{row}"] = "Substantial Work Sessions"
-ws_success[f"B{row}"] = substantial
-ws_success[f"C{row}"] = f"{(substantial / total_sessions) * 100:.1f}%"
-
-row += 2
-ws_success[f"A{row}"] = "Average Metrics"
-ws_success[f"A{row}"].font = Font(bold=True)
-ws_success.merge_cells(f"A{row}:C{row}")
-
-row += 1
-# Average turns
-avg_turns = sum(int(s.get("Turn Count", 0) or 0) for s in sessions) / total_sessions
-ws_success[f"A{row}"] = "Average Turns per Session"
-ws_success[f"B{row}"] = f"{avg_turns:.1f}"
-
-row += 1
-# Average messages
-avg_messages = (
-    sum(int(s.get("Message Count", 0) or 0) for s in sessions) / total_sessions
-)
-ws_success[f"A{row}"] = "Average Messages per Session"
-ws_success[f"B{row}"] = f"{avg_messages:.1f}"
-
-for col in ["A", "B", "C"]:
-    ws_success.column_dimensions[col].width = 35
-
-# ===== SHEET 6: Raw Data =====
-ws_raw = wb.create_sheet("Raw Data")
-
-# Read CSV and write to sheet
-with open(csv_path, "r") as f:
-    reader = csv.reader(f)
-    for r_idx, row in enumerate(reader, 1):
-        for c_idx, value in enumerate(row, 1):
-            ws_raw.cell(row=r_idx, column=c_idx, value=value)
-
-# Format headers
-for col in range(1, len(sessions[0]) + 1):
-    cell = ws_raw.cell(row=1, column=col)
-    cell.font = Font(bold=True)
-    cell.fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-
-# Freeze top row
-ws_raw.freeze_panes = "A2"
-
-# Save
-output_path = (
-    Path.home() / "Downloads" / "amplifier-sessions-problem-solving-dashboard.xlsx"
-)
-wb.save(output_path)
-print(f"✅ Dashboard created: {output_path}")
-print(f"📊 Analyzed {total_sessions} sessions")
-print(f"📈 {len(approach_counter)} unique approaches identified")
+    timeline.insert(0, "Total Sessions", created_dates[dated].value_counts())
+
+    for col in ["A", "B", "C", "D", "E", "F"]:
+        ws_time.column_dimensions[col].width = 15
+
+    ws_time.append(header_row(ws_time, ["Date", "Total Sessions", *TIMELINE_APPROACHES]))
+    for date, counts in timeline.iterrows():
+        ws_time.append([date, *(int(count) for count in counts)])
+
+    # ===== SHEET 5: Success Patterns =====
+    ws_success = wb.create_sheet("Success Patterns")
+
+    for col in ["A", "B", "C"]:
+        ws_success.column_dimensions[col].width = 35
+
+    success_counts = data.success_flags.sum()
+    success_rows = [
+        ("Files Modified", "Sessions with File Modifications"),
+        ("Validated", "Sessions with Validation"),
+        ("Good Error Recovery", "Sessions with Good Error Recovery"),
+        ("Substantial Work", "Substantial Work Sessions"),
+    ]
+    # Title (row 1), header (row 3), one row per indicator, a blank row, then "Average Metrics"
+    average_row = 3 + len(success_rows) + 2
+    ws_success.merged_cells.add("A1:C1")
+    ws_success.merged_cells.add(f"A{average_row}:C{average_row}")
+
+    ws_success.append([styled(ws_success, "Pattern Analysis", "Section Title")])
+    ws_success.append([])
+    ws_success.append(header_row(ws_success, ["Metric", "Value", "Notes"]))
+    for indicator, label in success_rows:
+        count = int(success_counts.get(indicator, 0))
+        ws_success.append([label, count, f"{(count / total_sessions) * 100:.1f}%"])
+    ws_success.append([])
+    ws_success.append([styled(ws_success, "Average Metrics", "Section Label")])
+
+    # Average turns
+    avg_turns = data.turn_count.sum() / total_sessions
+    ws_success.append(["Average Turns per Session", f"{avg_turns:.1f}"])
+
+    # Average messages
+    avg_messages = data.message_count.sum() / total_sessions
+    ws_success.append(["Average Messages per Session", f"{avg_messages:.1f}"])
+
+    # ===== SHEET 6: Raw Data =====
+    ws_raw = wb.create_sheet("Raw Data")
+
+    # Freeze top row
+    ws_raw.freeze_panes = "A2"
+
+    # Stream the already-loaded data rather than re-reading the source
+    ws_raw.append(header_row(ws_raw, list(data.raw.columns)))
+    for values in data.raw.itertuples(index=False):
+        ws_raw.append(list(values))
+
+    output_path = Path(output)
+    wb.save(output_path)
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create an Excel dashboard from analyze_sessions.py output.")
+    parser.add_argument("input", nargs="?", default=str(DEFAULT_INPUT), help=f"Session CSV (default: {DEFAULT_INPUT})")
+    parser.add_argument("output", nargs="?", default=str(DEFAULT_OUTPUT), help="Output XLSX (default: in ~/Downloads)")
+    args = parser.parse_args()
+
+    csv_path = Path(args.input)
+    if not csv_path.exists():
+        print(f"Error: Input file not found: {csv_path}", file=sys.stderr)
+        sys.exit(1)
+
+    data = DashboardData.from_csv(csv_path)
+    if not len(data):
+        print(f"Error: No sessions in {csv_path}", file=sys.stderr)
+        sys.exit(1)
+
+    output_path = build_dashboard(data, args.output)
+    print(f"✅ Dashboard created: {output_path}")
+    print(f"📊 Analyzed {len(data)} sessions")
+    print(f"📈 {data.approaches.nunique()} unique approaches identified")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,13 @@ and generates equivalent PowerPoint presentations using python-pptx.
 
 Usage:
     uv run --with python-pptx,beautifulsoup4,lxml python tools/html2pptx.py <input.html> [output.pptx]
+    uv run --with python-pptx,beautifulsoup4,lxml python tools/html2pptx.py docs/ staging/*.html [-o out/] [-j N]
 
 If output path is not specified, uses the input filename with .pptx extension.
+Directories and glob patterns switch to batch mode, which converts every deck
+across a process pool and exits non-zero if any deck fails. Batch mode keeps a
+build manifest (content hash + converter version per deck) and skips decks whose
+.pptx is already up to date; pass --force to rebuild everything.
 
 The tool extracts:
 - Slide structure (each .slide div)
@@ -23,17 +28,36 @@ The tool extracts:
 """
 
 import argparse
+import glob
+import hashlib
+import io
+import json
+import os
 import re
 import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
-from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
-from pptx.util import Inches, Pt
+from pptx.enum.text import MSO_ANCHOR, MSO_AUTO_SIZE, PP_ALIGN
+from pptx.util import Emu, Inches, Pt
+
+try:
+    from lxml import etree
+except ImportError:  # BeautifulSoup (html.parser) remains available as the fallback engine
+    etree = None
+
+# Bump whenever layout/styling changes so incremental builds regenerate every deck
+CONVERTER_VERSION = "5"
+MANIFEST_NAME = ".html2pptx-manifest.json"
 
 # Color palette (matching Amplifier Stories style)
 BLACK = RGBColor(0x00, 0x00, 0x00)
@@ -49,6 +73,85 @@ DARK_GRAY = RGBColor(0x1A, 0x1A, 0x1A)
 BORDER_GRAY = RGBColor(0x33, 0x33, 0x33)
 
 
+@dataclass(frozen=True)
+class ShapeStyle:
+    """Fill and outline for an auto shape; line=None means no outline."""
+
+    fill: RGBColor
+    line: Optional[RGBColor] = None
+    line_width: Optional[int] = None  # EMU
+
+
+class DeckTheme:
+    """Everything that is identical across decks, built once per process.
+
+    Holds a serialized, pre-sized 16:9 base presentation (so each converter
+    loads it from memory instead of re-reading and re-sizing python-pptx's
+    default template), the index of the blank layout, and the precomputed
+    shape styles used by cards, tenets and highlight boxes.
+    """
+
+    SLIDE_WIDTH = Inches(10)
+    SLIDE_HEIGHT = Inches(5.625)
+    BLANK_LAYOUT_INDEX = 6
+
+    def __init__(self):
+        base = Presentation()
+        base.slide_width = self.SLIDE_WIDTH
+        base.slide_height = self.SLIDE_HEIGHT
+        buffer = io.BytesIO()
+        base.save(buffer)
+        self.base_pptx = buffer.getvalue()
+
+        border = Pt(1)
+        self.card = ShapeStyle(DARK_GRAY, BORDER_GRAY, border)
+        self.tenet_accents = {color: ShapeStyle(color) for color in (MS_GREEN, MS_ORANGE, MS_RED, MS_BLUE, MS_CYAN)}
+        self.tenet_backgrounds = {
+            MS_GREEN: ShapeStyle(RGBColor(0x0D, 0x1A, 0x0D)),
+            MS_ORANGE: ShapeStyle(RGBColor(0x1A, 0x15, 0x0D)),
+            MS_RED: ShapeStyle(RGBColor(0x1A, 0x0D, 0x0D)),
+        }
+        self.tenet_default_background = ShapeStyle(RGBColor(0x0D, 0x15, 0x1A))
+        highlight_backgrounds = {
+            MS_GREEN: RGBColor(0x00, 0x1A, 0x0D),
+            MS_ORANGE: RGBColor(0x33, 0x1A, 0x00),
+        }
+        self.highlights = {
+            color: ShapeStyle(highlight_backgrounds.get(color, RGBColor(0x00, 0x1A, 0x33)), color, border)
+            for color in (MS_GREEN, MS_ORANGE, MS_RED, MS_BLUE, MS_CYAN)
+        }
+
+    def new_presentation(self) -> Presentation:
+        """Return a fresh, pre-sized presentation."""
+        return Presentation(io.BytesIO(self.base_pptx))
+
+    def tenet_background(self, accent_color: RGBColor) -> ShapeStyle:
+        return self.tenet_backgrounds.get(accent_color, self.tenet_default_background)
+
+    def tenet_accent(self, accent_color: RGBColor) -> ShapeStyle:
+        return self.tenet_accents.get(accent_color) or ShapeStyle(accent_color)
+
+    def highlight(self, color: RGBColor) -> ShapeStyle:
+        return self.highlights.get(color) or ShapeStyle(RGBColor(0x00, 0x1A, 0x33), color, Pt(1))
+
+
+@cache
+def get_theme() -> DeckTheme:
+    """Return the process-wide DeckTheme, building it on first use."""
+    return DeckTheme()
+
+
+def apply_shape_style(shape, style: ShapeStyle):
+    """Apply a precomputed fill/outline to an auto shape."""
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = style.fill
+    if style.line is None:
+        shape.line.fill.background()
+    else:
+        shape.line.color.rgb = style.line
+        shape.line.width = style.line_width
+
+
 def parse_color_from_class(classes: list[str]) -> Optional[RGBColor]:
     """Extract accent color from CSS classes."""
     color_map = {
@@ -75,6 +178,148 @@ def get_text(element: Optional[Tag]) -> str:
     return element.get_text(strip=True)
 
 
+# Text measurement
+#
+# Box heights are derived from wrapped text rather than fixed increments. Widths
+# come from Helvetica/Arial advance widths (1/1000 em) for printable ASCII, which
+# is close enough to Segoe UI/Calibri for line-break estimation without a font
+# rasterizer. Measurements are memoized, so repeated strings are measured once.
+
+_ASCII_ADVANCE = dict(
+    zip(
+        map(chr, range(32, 127)),
+        [
+            278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,  # space - /
+            556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,  # 0 - ?
+            1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,  # @ - O
+            667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,  # P - _
+            333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,  # ` - o
+            556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,  # p - ~
+        ],
+    )
+)
+BOLD_WIDTH_FACTOR = 1.07
+LINE_SPACING = 1.2  # line height as a multiple of the font size
+TEXT_INSET_X = 0.1  # python-pptx default text frame margins, inches
+TEXT_INSET_Y = 0.05
+
+SECTION_LABEL_HEIGHT = 0.4
+BLOCK_GAP = 0.15  # vertical space between stacked blocks
+SMALL_TEXT_TOP = 4.8
+MIN_TABLE_ROW_HEIGHT = 0.32
+TABLE_WIDTH = 8.4
+MIN_TABLE_COLUMN_WIDTH = 0.8
+MIN_CARD_WIDTH = 1.8  # narrower rows of cards wrap onto another row
+SLIDE_BOTTOM_MARGIN = 0.2  # content that ends lower is shrunk to fit (see fit_to_slide)
+MIN_FIT_SCALE = 0.6
+MIN_CLAMPED_HEIGHT = 0.2
+
+
+def _advance(char: str) -> int:
+    width = _ASCII_ADVANCE.get(char)
+    if width is not None:
+        return width
+    if unicodedata.combining(char):
+        return 0
+    return 1000 if unicodedata.east_asian_width(char) in ("W", "F") else 556
+
+
+@lru_cache(maxsize=65536)
+def text_width(text: str, font_size: float, bold: bool = False) -> float:
+    """Estimated rendered width of a single line of text, in inches."""
+    em = sum(_advance(c) for c in text) / 1000
+    return em * font_size / 72 * (BOLD_WIDTH_FACTOR if bold else 1.0)
+
+
+@lru_cache(maxsize=16384)
+def count_lines(text: str, font_size: float, width: float, bold: bool = False) -> int:
+    """Number of lines text wraps to inside a text box of the given width (inches)."""
+    if not text:
+        return 0
+    available = max(width - 2 * TEXT_INSET_X, 0.1)
+    space = text_width(" ", font_size, bold)
+    lines = 0
+    for paragraph in text.split("\n"):
+        lines += 1
+        line_width = 0.0
+        for word in paragraph.split(" "):
+            word_width = text_width(word, font_size, bold)
+            if line_width and line_width + space + word_width > available:
+                lines += 1
+                line_width = 0.0
+            if word_width > available:
+                # Words longer than the box break mid-word
+                extra, word_width = divmod(word_width, available)
+                lines += int(extra)
+            line_width += (space if line_width else 0.0) + word_width
+    return lines
+
+
+def text_height(text: str, font_size: float, width: float, bold: bool = False) -> float:
+    """Height (inches) of a text box that fits text at font_size without overflowing."""
+    return count_lines(text, font_size, width, bold) * font_size * LINE_SPACING / 72 + 2 * TEXT_INSET_Y
+
+
+def card_height(title: str, text: str, width: float) -> float:
+    """Height of a title + description card (see add_card)."""
+    inner = width - 0.3
+    return 0.15 + max(text_height(title, 16, inner, bold=True), 0.35) + text_height(text, 12, inner) + 0.15
+
+
+def number_card_height(title: str, text: str, width: float) -> float:
+    """Height of a big-number card (see HTMLToPPTXConverter._add_number_card)."""
+    inner = width - 0.2
+    return 0.8 + text_height(title, 14, inner, bold=True) + text_height(text, 10, inner) + 0.1
+
+
+def tenet_height(title: str, text: str, width: float) -> float:
+    """Height of a tenet box (see add_tenet)."""
+    inner = width - 0.3
+    return 0.1 + max(text_height(title, 14, inner, bold=True), 0.3) + text_height(text, 11, inner) + 0.05
+
+
+def highlight_box_height(text: str) -> float:
+    """Height of a highlight/callout box (see add_highlight_box)."""
+    return text_height(text, 14, 8.0) + 0.2
+
+
+def table_column_widths(grid: list[list[tuple]], num_cols: int, total_width: float) -> list[float]:
+    """Split total_width across columns in proportion to their widest single-line content.
+
+    grid rows hold (text, font_size, bold, color) tuples. Every column gets at
+    least MIN_TABLE_COLUMN_WIDTH so short columns stay readable next to long ones.
+    """
+    natural = [MIN_TABLE_COLUMN_WIDTH] * num_cols
+    for styled in grid:
+        for col_idx, (text, font_size, bold, _) in enumerate(styled):
+            natural[col_idx] = max(natural[col_idx], text_width(text, font_size, bold) + 2 * TEXT_INSET_X)
+
+    floor = min(MIN_TABLE_COLUMN_WIDTH, total_width / num_cols)
+    # Scale to the table width, then take back whatever the floor added from the wider columns
+    scale = total_width / sum(natural)
+    widths = [max(width * scale, floor) for width in natural]
+    excess = sum(widths) - total_width
+    if excess > 0:
+        shrinkable = sum(width - floor for width in widths)
+        widths = [width - excess * (width - floor) / shrinkable for width in widths]
+    return widths
+
+
+def style_table_cell(cell, text: str, font_size: int, bold: bool, color: RGBColor, fill: RGBColor = BLACK):
+    """Fill a native table cell with styled text on a solid background."""
+    cell.fill.solid()
+    cell.fill.fore_color.rgb = fill
+    cell.margin_left = cell.margin_right = Inches(TEXT_INSET_X)
+    cell.margin_top = cell.margin_bottom = Inches(TEXT_INSET_Y)
+    tf = cell.text_frame
+    tf.word_wrap = True
+    p = tf.paragraphs[0]
+    p.text = text
+    p.font.size = Pt(font_size)
+    p.font.bold = bold
+    p.font.color.rgb = color
+
+
 def set_slide_background(slide, color=BLACK):
     """Set solid background color for a slide."""
     background = slide.background
@@ -111,6 +356,58 @@ def add_text_box(
     return box
 
 
+@dataclass(frozen=True)
+class ParagraphSpec:
+    """One styled paragraph inside a merged text frame."""
+
+    text: str
+    font_size: int = 14
+    color: RGBColor = WHITE
+    bold: bool = False
+    space_after: float = 0.0  # inches
+
+
+def paragraphs_height(paragraphs: list[ParagraphSpec], width: float) -> float:
+    """Height (inches) of a text frame holding the given paragraphs at width."""
+    if not paragraphs:
+        return 0.0
+    lines = sum(
+        count_lines(p.text, p.font_size, width, p.bold) * p.font_size * LINE_SPACING / 72 + p.space_after
+        for p in paragraphs
+    )
+    return lines + 2 * TEXT_INSET_Y
+
+
+def add_paragraphs_box(
+    slide,
+    paragraphs: list[ParagraphSpec],
+    left: float,
+    top: float,
+    width: float,
+    align: PP_ALIGN = PP_ALIGN.LEFT,
+) -> float:
+    """Add one text box holding several styled paragraphs; returns its height.
+
+    Used instead of one add_text_box per item to keep shape counts (and
+    the slide XML) small for lists, versus columns and stat grids.
+    """
+    height = paragraphs_height(paragraphs, width)
+    box = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(height))
+    tf = box.text_frame
+    tf.word_wrap = True
+    for i, spec in enumerate(paragraphs):
+        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+        p.alignment = align
+        if spec.space_after:
+            p.space_after = Inches(spec.space_after)
+        run = p.add_run()
+        run.text = spec.text
+        run.font.size = Pt(spec.font_size)
+        run.font.bold = spec.bold
+        run.font.color.rgb = spec.color
+    return height
+
+
 def add_section_label(slide, text: str, top: float = 0.6):
     """Add a blue uppercase section label."""
     return add_text_box(
@@ -119,7 +416,7 @@ def add_section_label(slide, text: str, top: float = 0.6):
         left=0.8,
         top=top,
         width=8.4,
-        height=0.4,
+        height=SECTION_LABEL_HEIGHT,
         font_size=14,
         bold=True,
         color=MS_BLUE,
@@ -137,7 +434,7 @@ def add_headline(
         left=0.8,
         top=top,
         width=8.4,
-        height=1.5,
+        height=text_height(text, size, 8.4, bold=True),
         font_size=size,
         bold=True,
         color=color,
@@ -153,7 +450,7 @@ def add_subhead(slide, text: str, top: float = 2.8, color: RGBColor = GRAY_70, c
         left=0.8,
         top=top,
         width=8.4,
-        height=1.0,
+        height=text_height(text, 24, 8.4),
         font_size=24,
         color=color,
         align=PP_ALIGN.CENTER if center else PP_ALIGN.LEFT,
@@ -175,19 +472,17 @@ def add_card(
     card = slide.shapes.add_shape(
         MSO_SHAPE.ROUNDED_RECTANGLE, Inches(left), Inches(top), Inches(width), Inches(height)
     )
-    card.fill.solid()
-    card.fill.fore_color.rgb = DARK_GRAY
-    card.line.color.rgb = BORDER_GRAY
-    card.line.width = Pt(1)
+    apply_shape_style(card, get_theme().card)
 
     # Card title
+    title_height = max(text_height(title, 16, width - 0.3, bold=True), 0.35)
     add_text_box(
         slide,
         title,
         left=left + 0.15,
         top=top + 0.15,
         width=width - 0.3,
-        height=0.4,
+        height=title_height,
         font_size=16,
         bold=True,
         color=title_color,
@@ -198,9 +493,9 @@ def add_card(
         slide,
         text,
         left=left + 0.15,
-        top=top + 0.5,
+        top=top + 0.15 + title_height,
         width=width - 0.3,
-        height=height - 0.6,
+        height=max(height - 0.3 - title_height, 0.1),
         font_size=12,
         color=GRAY_70,
     )
@@ -217,38 +512,27 @@ def add_tenet(
     accent_color: RGBColor = MS_GREEN,
 ):
     """Add a tenet box with left border accent."""
-    # Background color based on accent
-    if accent_color == MS_GREEN:
-        bg_color = RGBColor(0x0D, 0x1A, 0x0D)
-    elif accent_color == MS_ORANGE:
-        bg_color = RGBColor(0x1A, 0x15, 0x0D)
-    elif accent_color == MS_RED:
-        bg_color = RGBColor(0x1A, 0x0D, 0x0D)
-    else:
-        bg_color = RGBColor(0x0D, 0x15, 0x1A)
+    theme = get_theme()
 
-    # Background
+    # Background tinted by accent
     box = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(left), Inches(top), Inches(width), Inches(height))
-    box.fill.solid()
-    box.fill.fore_color.rgb = bg_color
-    box.line.fill.background()
+    apply_shape_style(box, theme.tenet_background(accent_color))
 
     # Left accent bar
     accent = slide.shapes.add_shape(
         MSO_SHAPE.RECTANGLE, Inches(left), Inches(top), Inches(0.05), Inches(height)
     )
-    accent.fill.solid()
-    accent.fill.fore_color.rgb = accent_color
-    accent.line.fill.background()
+    apply_shape_style(accent, theme.tenet_accent(accent_color))
 
     # Title
+    title_height = max(text_height(title, 14, width - 0.3, bold=True), 0.3)
     add_text_box(
         slide,
         title,
         left=left + 0.15,
         top=top + 0.1,
         width=width - 0.3,
-        height=0.3,
+        height=title_height,
         font_size=14,
         bold=True,
         color=WHITE,
@@ -259,54 +543,331 @@ def add_tenet(
         slide,
         text,
         left=left + 0.15,
-        top=top + 0.4,
+        top=top + 0.1 + title_height,
         width=width - 0.3,
-        height=height - 0.5,
+        height=max(height - 0.15 - title_height, 0.1),
         font_size=11,
         color=GRAY_70,
     )
 
 
-def add_highlight_box(slide, text: str, top: float = 4.2, color: RGBColor = MS_BLUE):
-    """Add a highlight/callout box."""
-    if color == MS_GREEN:
-        bg_color = RGBColor(0x00, 0x1A, 0x0D)
-    elif color == MS_ORANGE:
-        bg_color = RGBColor(0x33, 0x1A, 0x00)
-    else:
-        bg_color = RGBColor(0x00, 0x1A, 0x33)
-
-    box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.8), Inches(top), Inches(8.4), Inches(0.7))
-    box.fill.solid()
-    box.fill.fore_color.rgb = bg_color
-    box.line.color.rgb = color
-    box.line.width = Pt(1)
+def add_highlight_box(slide, text: str, top: float = 4.2, color: RGBColor = MS_BLUE, height: Optional[float] = None):
+    """Add a highlight/callout box, sized to its text unless height is given."""
+    if height is None:
+        height = highlight_box_height(text)
+    box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(0.8), Inches(top), Inches(8.4), Inches(height))
+    apply_shape_style(box, get_theme().highlight(color))
 
     add_text_box(
         slide,
         text,
         left=1.0,
-        top=top + 0.15,
+        top=top + 0.1,
         width=8.0,
-        height=0.5,
+        height=height - 0.2,
         font_size=14,
         color=WHITE,
     )
 
 
-class HTMLToPPTXConverter:
-    """Converts Amplifier Stories HTML decks to PowerPoint."""
+def _scale_text_frame(tf, scale: float):
+    """Multiply every explicit font size and paragraph spacing in a text frame by scale."""
+    for p in tf.paragraphs:
+        if p.font.size is not None:
+            p.font.size = Pt(p.font.size.pt * scale)
+        if p.space_after is not None:
+            p.space_after = int(p.space_after * scale)
+        for run in p.runs:
+            if run.font.size is not None:
+                run.font.size = Pt(run.font.size.pt * scale)
+
+
+def fit_to_slide(slide, slide_height: int):
+    """Keep every shape on the slide, shrinking the content when it runs past the bottom.
+
+    Measured blocks are stacked without regard to the slide height, so long
+    content can run off the bottom. Overflowing slides are scaled vertically
+    about the top of the content, with fonts shrunk by the same factor; widths
+    are kept, so the smaller text wraps to no more lines than was measured.
+    Text is not shrunk below MIN_FIT_SCALE; anything still past the bottom is
+    clamped to it and set to shrink on overflow in PowerPoint.
+    """
+    shapes = list(slide.shapes)
+    if not shapes:
+        return
+    limit = slide_height - Inches(SLIDE_BOTTOM_MARGIN)
+    content_top = min(shape.top for shape in shapes)
+    bottom = max(shape.top + shape.height for shape in shapes)
+    if bottom <= limit:
+        return
+
+    scale = max((limit - content_top) / (bottom - content_top), MIN_FIT_SCALE)
+    for shape in shapes:
+        shape.top = content_top + int((shape.top - content_top) * scale)
+        if shape.has_text_frame:
+            _scale_text_frame(shape.text_frame, scale)
+        if getattr(shape, "has_table", False):
+            for row in shape.table.rows:
+                row.height = int(row.height * scale)
+                for cell in row.cells:
+                    _scale_text_frame(cell.text_frame, scale)
+        shape.height = int(shape.height * scale)
+
+        if shape.top + shape.height > limit:
+            shape.top = min(shape.top, limit - Inches(MIN_CLAMPED_HEIGHT))
+            shape.height = limit - shape.top
+            if shape.has_text_frame:
+                shape.text_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
+
+
+class LxmlElement:
+    """BeautifulSoup-compatible view over an lxml element.
+
+    Implements only the subset of the Tag API that the layout code uses
+    (name, children, get, find, find_all, find_next_sibling, get_text, str),
+    so slides parsed by the lxml engine flow through the same layout code.
+    """
+
+    __slots__ = ("_el",)
+
+    def __init__(self, el):
+        self._el = el
+
+    def __eq__(self, other):
+        return isinstance(other, LxmlElement) and other._el is self._el
+
+    def __hash__(self):
+        return id(self._el)
+
+    def __str__(self):
+        return etree.tostring(self._el, method="html", encoding="unicode", with_tail=False)
+
+    @property
+    def name(self) -> str:
+        return self._el.tag
+
+    @property
+    def children(self) -> Iterator["LxmlElement"]:
+        for child in self._el:
+            if isinstance(child.tag, str):
+                yield LxmlElement(child)
+
+    def get(self, key: str, default=None):
+        value = self._el.get(key)
+        if value is None:
+            return default
+        return value.split() if key == "class" else value
+
+    @staticmethod
+    def _matches(el, name, class_) -> bool:
+        if not isinstance(el.tag, str):
+            return False
+        if name is not None and (el.tag != name if isinstance(name, str) else el.tag not in name):
+            return False
+        if class_ is not None:
+            classes = (el.get("class") or "").split()
+            if isinstance(class_, str):
+                return class_ in classes
+            return any(cls in classes for cls in class_)
+        return True
+
+    def find_all(self, name=None, class_=None) -> list["LxmlElement"]:
+        return [LxmlElement(el) for el in self._el.iterdescendants() if self._matches(el, name, class_)]
+
+    def find(self, name=None, class_=None) -> Optional["LxmlElement"]:
+        for el in self._el.iterdescendants():
+            if self._matches(el, name, class_):
+                return LxmlElement(el)
+        return None
+
+    def find_next_sibling(self, name=None, class_=None) -> Optional["LxmlElement"]:
+        for el in self._el.itersiblings():
+            if self._matches(el, name, class_):
+                return LxmlElement(el)
+        return None
+
+    def get_text(self, strip: bool = False) -> str:
+        strings = self._el.itertext()
+        if strip:
+            return "".join(text for text in (t.strip() for t in strings) if text)
+        return "".join(strings)
+
+
+Element = Union[Tag, LxmlElement]
+
+
+def iter_slides_lxml(html_content: str) -> Iterator[LxmlElement]:
+    """Stream .slide divs out of an HTML document with lxml's iterparse.
+
+    Each top-level slide is yielded as soon as its closing tag is parsed and
+    then cleared, together with the already-processed siblings before it, so
+    only one slide subtree is held in memory at a time. <script> and <style>
+    bodies are dropped as they close and never reach the layout code.
+    """
+    open_slides = 0
+    events = etree.iterparse(
+        io.BytesIO(html_content.encode("utf-8")),
+        events=("start", "end"),
+        tag=("div", "script", "style"),
+        html=True,
+        encoding="utf-8",
+        remove_comments=True,
+        remove_pis=True,
+    )
+    for event, el in events:
+        if el.tag != "div":
+            if event == "end":
+                el.clear(keep_tail=True)
+            continue
+        if "slide" not in (el.get("class") or "").split():
+            continue
+        if event == "start":
+            open_slides += 1
+            continue
+
+        open_slides -= 1
+        yield LxmlElement(el)
+        if open_slides == 0:
+            el.clear(keep_tail=True)
+            parent = el.getparent()
+            while el.getprevious() is not None:
+                del parent[0]
+
+
+CARD_CONTAINER_CLASSES = frozenset({"thirds", "halves", "fourths"})
+INDEXED_CLASSES = frozenset(
+    {
+        "section-label",
+        "headline",
+        "medium-headline",
+        "subhead",
+        "card",
+        "tenet",
+        "versus",
+        "data-table",
+        "feature-list",
+        "highlight-box",
+        "stat-grid",
+        "quote",
+        "small-text",
+    }
+)
+
+
+class SlideIndex:
+    """Single-pass index of the recognized elements inside one slide.
+
+    Walks the slide subtree once and buckets every element carrying one of
+    INDEXED_CLASSES (in document order), so the layout code never rescans the
+    slide. Container membership for cards and the "inside a versus" check for
+    feature lists are resolved during the walk instead of via find_parent.
+    """
+
+    def __init__(self, slide_div: Tag):
+        self.by_class: dict[str, list[Tag]] = {cls: [] for cls in INDEXED_CLASSES}
+        self.first_h1: Optional[Tag] = None
+        self.card_groups: list[list[Tag]] = []  # cards per .thirds/.halves/.fourths container
+        self.standalone_cards: list[Tag] = []
+        self.feature_lists: list[Tag] = []  # excluding lists inside .versus
+        self._walk(slide_div, [], False)
+
+    def _walk(self, node: Tag, open_groups: list[list[Tag]], in_versus: bool):
+        for child in node.children:
+            if child.name is None:  # text, comments
+                continue
+
+            classes = child.get("class") or ()
+            child_groups = open_groups
+            child_in_versus = in_versus
+            for cls in classes:
+                if cls in INDEXED_CLASSES:
+                    bucket = self.by_class[cls]
+                    if not bucket or bucket[-1] is not child:
+                        bucket.append(child)
+                if cls in CARD_CONTAINER_CLASSES and child_groups is open_groups:
+                    group: list[Tag] = []
+                    self.card_groups.append(group)
+                    child_groups = open_groups + [group]
+
+            if child.name == "h1" and self.first_h1 is None:
+                self.first_h1 = child
+            if "card" in classes:
+                if open_groups:
+                    for group in open_groups:
+                        group.append(child)
+                else:
+                    self.standalone_cards.append(child)
+            if "feature-list" in classes and not in_versus:
+                self.feature_lists.append(child)
+            if "versus" in classes:
+                child_in_versus = True
+
+            self._walk(child, child_groups, child_in_versus)
 
-    def __init__(self, html_content: str):
-        self.soup = BeautifulSoup(html_content, "lxml")
-        self.prs = Presentation()
-        self.prs.slide_width = Inches(10)
-        self.prs.slide_height = Inches(5.625)
-        self.blank_layout = self.prs.slide_layouts[6]
+    def first(self, cls: str) -> Optional[Tag]:
+        """Return the first element with the given class, in document order."""
+        bucket = self.by_class[cls]
+        return bucket[0] if bucket else None
 
-    def extract_slides(self) -> list[Tag]:
-        """Extract all slide divs from the HTML."""
-        return self.soup.find_all("div", class_="slide")
+    def all(self, cls: str) -> list[Tag]:
+        """Return every element with the given class, in document order."""
+        return self.by_class[cls]
+
+    @property
+    def headline(self) -> Optional[Tag]:
+        """First h1/h2.headline, falling back to the first h1."""
+        for el in self.by_class["headline"]:
+            if el.name in ("h1", "h2"):
+                return el
+        return self.first_h1
+
+    @property
+    def tables(self) -> list[Tag]:
+        """All table.data-table elements."""
+        return [el for el in self.by_class["data-table"] if el.name == "table"]
+
+
+ENGINES = ("lxml", "bs4")
+DEFAULT_ENGINE = "lxml" if etree is not None else "bs4"
+# "merged": one text frame per list / versus column / stat; "boxes": one text box per item
+TEXT_MODES = ("merged", "boxes")
+DEFAULT_TEXT_MODE = "merged"
+
+
+class HTMLToPPTXConverter:
+    """Converts Amplifier Stories HTML decks to PowerPoint.
+
+    The default "lxml" engine streams slides out of the document as they are
+    parsed; the "bs4" engine builds a full BeautifulSoup tree first and is
+    kept as the fallback.
+
+    text_mode controls how feature lists, versus columns and stat grids are
+    emitted: "merged" renders each as a single text frame with one styled
+    paragraph per item, "boxes" uses a separate text box per item.
+    """
+
+    def __init__(self, html_content: str, engine: str = DEFAULT_ENGINE, text_mode: str = DEFAULT_TEXT_MODE):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r} (expected one of {', '.join(ENGINES)})")
+        if text_mode not in TEXT_MODES:
+            raise ValueError(f"Unknown text mode {text_mode!r} (expected one of {', '.join(TEXT_MODES)})")
+        self.text_mode = text_mode
+        if engine == "lxml" and etree is None:
+            engine = "bs4"
+        self.engine = engine
+        self.html_content = html_content
+        self.soup = None
+        if engine == "bs4":
+            self.soup = BeautifulSoup(html_content, "lxml" if etree is not None else "html.parser")
+        self.theme = get_theme()
+        self.prs = self.theme.new_presentation()
+        self.blank_layout = self.prs.slide_layouts[self.theme.BLANK_LAYOUT_INDEX]
+
+    def extract_slides(self) -> Iterator[Element]:
+        """Extract all slide divs from the HTML, streaming them with the lxml engine."""
+        if self.engine == "lxml":
+            return iter_slides_lxml(self.html_content)
+        return iter(self.soup.find_all("div", class_="slide"))
 
     def is_centered(self, slide_div: Tag) -> bool:
         """Check if slide has center class."""
@@ -314,23 +875,29 @@ class HTMLToPPTXConverter:
         return "center" in classes
 
     def process_slide(self, slide_div: Tag, slide_num: int):
-        """Process a single slide div and add to presentation."""
+        """Process a single slide div and add to presentation.
+
+        Blocks are stacked top to bottom; each _add_* helper returns the height
+        it actually used (from measured text), so spacing follows content.
+        """
         slide = self.prs.slides.add_slide(self.blank_layout)
         set_slide_background(slide)
 
         is_centered = self.is_centered(slide_div)
         current_top = 0.6
 
+        index = SlideIndex(slide_div)
+
         # Extract section label
-        section_label = slide_div.find(class_="section-label")
+        section_label = index.first("section-label")
         if section_label:
             if is_centered:
                 current_top = 1.5
             add_section_label(slide, get_text(section_label), top=current_top)
-            current_top += 0.5
+            current_top += SECTION_LABEL_HEIGHT + 0.1
 
         # Extract headline (h1 or .headline)
-        headline = slide_div.find(["h1", "h2"], class_="headline") or slide_div.find("h1")
+        headline = index.headline
         if headline:
             text = get_text(headline).replace("<br>", "\n")
             # Check for gradient/big text styling
@@ -341,90 +908,77 @@ class HTMLToPPTXConverter:
             if is_centered:
                 current_top = max(current_top, 2.0)
 
-            add_headline(slide, text, top=current_top, size=size, center=is_centered, color=color)
-            current_top += 1.2 if size > 45 else 0.9
+            box = add_headline(slide, text, top=current_top, size=size, center=is_centered, color=color)
+            current_top += Emu(box.height).inches + BLOCK_GAP
 
         # Extract medium headline (h2.medium-headline)
-        medium_headline = slide_div.find(class_="medium-headline")
+        medium_headline = index.first("medium-headline")
         if medium_headline and medium_headline != headline:
-            add_headline(slide, get_text(medium_headline), top=current_top, size=36, center=is_centered)
-            current_top += 0.8
+            box = add_headline(slide, get_text(medium_headline), top=current_top, size=36, center=is_centered)
+            current_top += Emu(box.height).inches + BLOCK_GAP
 
         # Extract subhead
-        subhead = slide_div.find(class_="subhead") or slide_div.find("p", class_="subhead")
+        subhead = index.first("subhead")
         if subhead:
             text = get_text(subhead)
-            add_subhead(slide, text, top=current_top, center=is_centered)
-            current_top += 0.8
+            box = add_subhead(slide, text, top=current_top, center=is_centered)
+            current_top += Emu(box.height).inches + BLOCK_GAP
 
         # Extract cards (.card elements in .thirds or .halves or .fourths)
-        card_containers = slide_div.find_all(class_=["thirds", "halves", "fourths"])
-        for container in card_containers:
-            cards = container.find_all(class_="card")
+        for cards in index.card_groups:
             if cards:
-                self._add_cards(slide, cards, current_top)
-                current_top += 2.0
+                current_top += self._add_cards(slide, cards, current_top) + BLOCK_GAP
 
         # Extract standalone cards not in containers
-        standalone_cards = [
-            c for c in slide_div.find_all(class_="card") if not c.find_parent(class_=["thirds", "halves", "fourths"])
-        ]
+        standalone_cards = index.standalone_cards
         if standalone_cards:
-            self._add_cards(slide, standalone_cards, current_top)
-            current_top += 2.0
+            current_top += self._add_cards(slide, standalone_cards, current_top) + BLOCK_GAP
 
         # Extract tenet boxes
-        tenets = slide_div.find_all(class_="tenet")
+        tenets = index.all("tenet")
         if tenets:
-            self._add_tenets(slide, tenets, current_top)
-            current_top += len(tenets) * 0.5 + 0.5
+            current_top += self._add_tenets(slide, tenets, current_top) + BLOCK_GAP
 
         # Extract versus comparison
-        versus = slide_div.find(class_="versus")
+        versus = index.first("versus")
         if versus:
-            self._add_versus(slide, versus, current_top)
-            current_top += 2.5
+            current_top += self._add_versus(slide, versus, current_top) + BLOCK_GAP
 
         # Extract tables
-        tables = slide_div.find_all("table", class_="data-table")
-        for table in tables:
-            self._add_table(slide, table, current_top)
-            current_top += 2.5
+        for table in index.tables:
+            current_top += self._add_table(slide, table, current_top) + BLOCK_GAP
 
         # Extract feature lists
-        feature_lists = slide_div.find_all(class_="feature-list")
-        for fl in feature_lists:
-            if not fl.find_parent(class_="versus"):  # Skip lists inside versus
-                self._add_feature_list(slide, fl, current_top)
-                current_top += 1.5
+        for fl in index.feature_lists:  # Lists inside versus are excluded by the index
+            current_top += self._add_feature_list(slide, fl, current_top) + BLOCK_GAP
 
         # Extract highlight boxes
-        highlight_boxes = slide_div.find_all(class_="highlight-box")
-        for hb in highlight_boxes:
+        for hb in index.all("highlight-box"):
             classes = hb.get("class", [])
             color = parse_color_from_class(classes) or MS_BLUE
             text = get_text(hb)
-            add_highlight_box(slide, text, top=min(current_top, 4.5), color=color)
-            current_top += 0.8
+            height = highlight_box_height(text)
+            add_highlight_box(slide, text, top=current_top, color=color, height=height)
+            current_top += height + BLOCK_GAP
 
         # Extract stats grid
-        stat_grid = slide_div.find(class_="stat-grid")
+        stat_grid = index.first("stat-grid")
         if stat_grid:
-            self._add_stats(slide, stat_grid, current_top)
+            current_top += self._add_stats(slide, stat_grid, current_top) + BLOCK_GAP
 
         # Extract quote
-        quote = slide_div.find(class_="quote")
+        quote = index.first("quote")
         if quote:
-            self._add_quote(slide, quote, current_top)
+            current_top += self._add_quote(slide, quote, current_top) + BLOCK_GAP
 
-        # Extract small text at bottom
-        small_text = slide_div.find(class_="small-text")
+        # Extract small text at bottom, below the content when that runs past it
+        small_text = index.first("small-text")
         if small_text:
             add_text_box(
                 slide,
                 get_text(small_text),
                 left=0.8,
-                top=4.8,
+                top=max(current_top, SMALL_TEXT_TOP),
                 width=8.4,
                 height=0.4,
                 font_size=14,
@@ -432,16 +986,20 @@ class HTMLToPPTXConverter:
                 align=PP_ALIGN.CENTER if is_centered else PP_ALIGN.LEFT,
             )
 
-    def _add_cards(self, slide, cards: list[Tag], top: float):
-        """Add a row of cards to the slide."""
+        # Blocks are stacked top to bottom; shrink the slide if they ran past the bottom
+        fit_to_slide(slide, self.prs.slide_height)
+
+    def _add_cards(self, slide, cards: list[Tag], top: float) -> float:
+        """Add cards to the slide, wrapping into rows, and return the height used."""
         num_cards = len(cards)
         if num_cards == 0:
-            return
+            return 0.0
 
-        # Calculate layout
+        # Calculate layout: as many cards per row as fit at MIN_CARD_WIDTH
         total_width = 8.4
         gap = 0.2
-        card_width = (total_width - gap * (num_cards - 1)) / num_cards
+        per_row = min(num_cards, max(1, int((total_width + gap) // (MIN_CARD_WIDTH + gap))))
+        card_width = (total_width - gap * (per_row - 1)) / per_row
         card_width = min(card_width, 2.8)  # Max width
 
         start_left = 0.8
@@ -450,35 +1008,49 @@ class HTMLToPPTXConverter:
             gap = 0.3
             start_left = 0.8
 
-        for i, card in enumerate(cards):
+        contents = []
+        for card in cards:
             title_el = card.find(class_="card-title")
             text_el = card.find(class_="card-text")
             number_el = card.find(class_="card-number")
 
             title = get_text(title_el) if title_el else ""
             text = get_text(text_el) if text_el else ""
+            number = get_text(number_el) if number_el else None
+            contents.append((number, title, text))
+
+        row_top = top
+        for row_start in range(0, num_cards, per_row):
+            row = contents[row_start:row_start + per_row]
+            # Every card in a row shares the height of the tallest one
+            row_height = max(
+                number_card_height(title, text, card_width)
+                if number is not None
+                else card_height(title, text, card_width)
+                for number, title, text in row
+            )
 
-            left = start_left + i * (card_width + gap)
+            for i, (number, title, text) in enumerate(row):
+                left = start_left + i * (card_width + gap)
 
-            if number_el:
-                # Big number card
-                number = get_text(number_el)
-                self._add_number_card(slide, number, title, text, left, top, card_width)
-            else:
-                add_card(slide, title, text, left, top, width=card_width, height=1.8)
+                if number is not None:
+                    # Big number card
+                    self._add_number_card(slide, number, title, text, left, row_top, card_width, row_height)
+                else:
+                    add_card(slide, title, text, left, row_top, width=card_width, height=row_height)
+            row_top += row_height + gap
+
+        return row_top - gap - top
 
     def _add_number_card(
-        self, slide, number: str, title: str, text: str, left: float, top: float, width: float
+        self, slide, number: str, title: str, text: str, left: float, top: float, width: float, height: float = 1.8
     ):
         """Add a card with a big number."""
         # Card background
         card = slide.shapes.add_shape(
-            MSO_SHAPE.ROUNDED_RECTANGLE, Inches(left), Inches(top), Inches(width), Inches(1.8)
+            MSO_SHAPE.ROUNDED_RECTANGLE, Inches(left), Inches(top), Inches(width), Inches(height)
         )
-        card.fill.solid()
-        card.fill.fore_color.rgb = DARK_GRAY
-        card.line.color.rgb = BORDER_GRAY
-        card.line.width = Pt(1)
+        apply_shape_style(card, self.theme.card)
 
         # Big number
         add_text_box(
@@ -495,13 +1067,14 @@ class HTMLToPPTXConverter:
         )
 
         # Title
+        title_height = text_height(title, 14, width - 0.2, bold=True)
         add_text_box(
             slide,
             title,
             left=left + 0.1,
             top=top + 0.8,
             width=width - 0.2,
-            height=0.3,
+            height=title_height,
             font_size=14,
             bold=True,
             color=MS_BLUE,
@@ -513,64 +1086,91 @@ class HTMLToPPTXConverter:
             slide,
             text,
             left=left + 0.1,
-            top=top + 1.1,
+            top=top + 0.8 + title_height,
             width=width - 0.2,
-            height=0.5,
+            height=text_height(text, 10, width - 0.2),
             font_size=10,
             color=GRAY_70,
             align=PP_ALIGN.CENTER,
         )
 
-    def _add_tenets(self, slide, tenets: list[Tag], top: float):
-        """Add tenet boxes to the slide."""
-        num_tenets = len(tenets)
-
-        # Determine layout: 2 columns if 4+ tenets
-        if num_tenets >= 4:
-            for i, tenet in enumerate(tenets):
-                col = i % 2
-                row = i // 2
-                self._add_single_tenet(slide, tenet, 0.8 + col * 4.5, top + row * 1.0, width=4.2)
-        else:
-            for i, tenet in enumerate(tenets):
-                self._add_single_tenet(slide, tenet, 0.8, top + i * 1.0, width=8.4)
+    def _add_tenets(self, slide, tenets: list[Tag], top: float) -> float:
+        """Add tenet boxes to the slide and return the height used."""
+        contents = []
+        for tenet in tenets:
+            title_el = tenet.find(class_="tenet-title")
+            text_el = tenet.find(class_="tenet-text")
 
-    def _add_single_tenet(self, slide, tenet: Tag, left: float, top: float, width: float):
-        """Add a single tenet box."""
-        title_el = tenet.find(class_="tenet-title")
-        text_el = tenet.find(class_="tenet-text")
+            title = get_text(title_el) if title_el else ""
+            text = get_text(text_el) if text_el else ""
 
-        title = get_text(title_el) if title_el else ""
-        text = get_text(text_el) if text_el else ""
+            classes = tenet.get("class", [])
+            accent_color = parse_color_from_class(classes) or MS_GREEN
+            contents.append((title, text, accent_color))
 
-        classes = tenet.get("class", [])
-        accent_color = parse_color_from_class(classes) or MS_GREEN
+        # Determine layout: 2 columns if 4+ tenets
+        if len(contents) >= 4:
+            columns, width = 2, 4.2
+        else:
+            columns, width = 1, 8.4
+
+        row_top = top
+        for row_start in range(0, len(contents), columns):
+            row = contents[row_start:row_start + columns]
+            row_height = max(tenet_height(title, text, width) for title, text, _ in row)
+            for col, (title, text, accent_color) in enumerate(row):
+                add_tenet(
+                    slide,
+                    title,
+                    text,
+                    0.8 + col * 4.5,
+                    row_top,
+                    width=width,
+                    height=row_height,
+                    accent_color=accent_color,
+                )
+            row_top += row_height + 0.1
 
-        add_tenet(slide, title, text, left, top, width=width, accent_color=accent_color)
+        return row_top - 0.1 - top
 
-    def _add_versus(self, slide, versus: Tag, top: float):
-        """Add a versus comparison layout."""
+    def _add_versus(self, slide, versus: Tag, top: float) -> float:
+        """Add a versus comparison layout and return its height."""
         sides = versus.find_all(class_="versus-side")
         if len(sides) < 2:
-            return
+            return 0.0
 
-        left_side = sides[0]
-        right_side = sides[1]
+        left_height = self._add_versus_side(slide, sides[0], 0.8, top, MS_ORANGE)
+        right_height = self._add_versus_side(slide, sides[1], 5.5, top, MS_GREEN)
+        height = max(left_height, right_height, 0.5)
 
-        # Left title
-        left_title = left_side.find(class_="versus-title")
-        if left_title:
-            classes = left_title.get("class", [])
-            color = parse_color_from_class(classes) or MS_ORANGE
-            add_text_box(
-                slide, get_text(left_title), left=0.8, top=top, width=4.0, height=0.4, font_size=24, bold=True, color=color
-            )
+        # VS divider, vertically centered between the two columns
+        add_text_box(
+            slide,
+            "vs",
+            left=4.5,
+            top=top + (height - 0.5) / 2,
+            width=1.0,
+            height=0.5,
+            font_size=32,
+            bold=True,
+            color=GRAY_50,
+            align=PP_ALIGN.CENTER,
+        )
+        return height
+
+    def _add_versus_side(self, slide, side: Tag, left: float, top: float, default_color: RGBColor) -> float:
+        """Add one column of a versus comparison and return its height."""
+        paragraphs = []
 
-        # Left items
-        left_list = left_side.find(class_="feature-list")
-        if left_list:
-            items = left_list.find_all("li")
-            for i, item in enumerate(items):
+        title = side.find(class_="versus-title")
+        if title:
+            classes = title.get("class", [])
+            color = parse_color_from_class(classes) or default_color
+            paragraphs.append(ParagraphSpec(get_text(title), 24, color, bold=True, space_after=0.1))
+
+        items = side.find(class_="feature-list")
+        if items:
+            for item in items.find_all("li"):
                 text = get_text(item)
                 # Check for check/x marks
                 if "✓" in text or "check" in str(item):
@@ -579,62 +1179,49 @@ class HTMLToPPTXConverter:
                     color = MS_RED
                 else:
                     color = WHITE
-                add_text_box(
-                    slide, text, left=0.8, top=top + 0.5 + i * 0.35, width=4.0, height=0.35, font_size=14, color=color
-                )
+                paragraphs.append(ParagraphSpec(text, 14, color))
 
-        # VS divider
-        add_text_box(
-            slide, "vs", left=4.5, top=top + 1.2, width=1.0, height=0.5, font_size=32, bold=True, color=GRAY_50, align=PP_ALIGN.CENTER
-        )
+        return self._add_paragraphs(slide, paragraphs, left, top, 4.0)
+
+    def _add_paragraphs(
+        self, slide, paragraphs: list[ParagraphSpec], left: float, top: float, width: float, align=PP_ALIGN.LEFT
+    ) -> float:
+        """Emit paragraphs per self.text_mode and return the height used."""
+        if self.text_mode == "merged":
+            return add_paragraphs_box(slide, paragraphs, left, top, width, align=align)
 
-        # Right title
-        right_title = right_side.find(class_="versus-title")
-        if right_title:
-            classes = right_title.get("class", [])
-            color = parse_color_from_class(classes) or MS_GREEN
+        current_top = top
+        for spec in paragraphs:
+            height = text_height(spec.text, spec.font_size, width, bold=spec.bold)
             add_text_box(
-                slide, get_text(right_title), left=5.5, top=top, width=4.0, height=0.4, font_size=24, bold=True, color=color
+                slide,
+                spec.text,
+                left=left,
+                top=current_top,
+                width=width,
+                height=height,
+                font_size=spec.font_size,
+                bold=spec.bold,
+                color=spec.color,
+                align=align,
             )
+            current_top += height + spec.space_after
+        return current_top - top
 
-        # Right items
-        right_list = right_side.find(class_="feature-list")
-        if right_list:
-            items = right_list.find_all("li")
-            for i, item in enumerate(items):
-                text = get_text(item)
-                if "✓" in text or "check" in str(item):
-                    color = MS_GREEN
-                elif "✗" in text or "x-mark" in str(item):
-                    color = MS_RED
-                else:
-                    color = WHITE
-                add_text_box(
-                    slide, text, left=5.5, top=top + 0.5 + i * 0.35, width=4.0, height=0.35, font_size=14, color=color
-                )
-
-    def _add_table(self, slide, table: Tag, top: float):
-        """Add a data table to the slide."""
-        rows = table.find_all("tr")
+    def _add_table(self, slide, table: Tag, top: float) -> float:
+        """Add a data table as a native PowerPoint table and return its height."""
+        rows = [row.find_all(["th", "td"]) for row in table.find_all("tr")]
+        rows = [cells for cells in rows if cells]
         if not rows:
-            return
-
-        row_height = 0.32
-        for row_idx, row in enumerate(rows):
-            cells = row.find_all(["th", "td"])
-            is_header = row.find("th") is not None
+            return 0.0
 
-            # Calculate column widths based on content
-            num_cols = len(cells)
-            col_widths = [8.0 / num_cols] * num_cols
-            if num_cols >= 3:
-                col_widths = [2.5, 2.5, 3.0][:num_cols]
-
-            left = 0.8
+        # Resolve text and styling for every cell first; widths depend on all rows
+        grid = []
+        for cells in rows:
+            is_header = any(cell.name == "th" for cell in cells)
+            styled = []
             for col_idx, cell in enumerate(cells):
                 text = get_text(cell)
-                width = col_widths[col_idx] if col_idx < len(col_widths) else 2.0
-
                 if is_header:
                     color = MS_BLUE
                     font_size = 12
@@ -657,23 +1244,44 @@ class HTMLToPPTXConverter:
                     elif "~" in text:
                         color = MS_ORANGE
 
-                add_text_box(
-                    slide,
-                    text,
-                    left=left,
-                    top=top + row_idx * row_height,
-                    width=width,
-                    height=row_height,
-                    font_size=font_size,
-                    bold=bold,
-                    color=color,
-                )
-                left += width
+                styled.append((text, font_size, bold, color))
+            grid.append(styled)
+
+        num_cols = max(len(styled) for styled in grid)
+        col_widths = table_column_widths(grid, num_cols, TABLE_WIDTH)
+        row_heights = [
+            max(
+                [MIN_TABLE_ROW_HEIGHT]
+                + [
+                    text_height(text, font_size, col_widths[col_idx], bold=bold)
+                    for col_idx, (text, font_size, bold, _) in enumerate(styled)
+                ]
+            )
+            for styled in grid
+        ]
 
-    def _add_feature_list(self, slide, feature_list: Tag, top: float):
-        """Add a feature list to the slide."""
-        items = feature_list.find_all("li")
-        for i, item in enumerate(items):
+        frame = slide.shapes.add_table(
+            len(grid), num_cols, Inches(0.8), Inches(top), Inches(TABLE_WIDTH), Inches(sum(row_heights))
+        )
+        pptx_table = frame.table
+        # Plain cells on the slide background instead of the default banded theme style
+        pptx_table.first_row = False
+        pptx_table.horz_banding = False
+        for col_idx, width in enumerate(col_widths):
+            pptx_table.columns[col_idx].width = Inches(width)
+
+        for row_idx, styled in enumerate(grid):
+            pptx_table.rows[row_idx].height = Inches(row_heights[row_idx])
+            for col_idx in range(num_cols):
+                text, font_size, bold, color = styled[col_idx] if col_idx < len(styled) else ("", 11, False, GRAY_70)
+                style_table_cell(pptx_table.cell(row_idx, col_idx), text, font_size, bold, color)
+
+        return sum(row_heights)
+
+    def _add_feature_list(self, slide, feature_list: Tag, top: float) -> float:
+        """Add a feature list to the slide and return its height."""
+        paragraphs = []
+        for item in feature_list.find_all("li"):
             text = get_text(item)
 
             # Determine color from content
@@ -684,20 +1292,21 @@ class HTMLToPPTXConverter:
             else:
                 color = WHITE
 
-            add_text_box(
-                slide, text, left=0.8, top=top + i * 0.4, width=8.4, height=0.4, font_size=16, color=color
-            )
+            paragraphs.append(ParagraphSpec(text, 16, color))
 
-    def _add_stats(self, slide, stat_grid: Tag, top: float):
-        """Add a stats grid to the slide."""
+        return self._add_paragraphs(slide, paragraphs, 0.8, top, 8.4)
+
+    def _add_stats(self, slide, stat_grid: Tag, top: float) -> float:
+        """Add a stats grid to the slide and return its height."""
         stats = stat_grid.find_all(class_="stat")
         num_stats = len(stats)
         if num_stats == 0:
-            return
+            return 0.0
 
         width_per_stat = 8.4 / num_stats
         start_left = 0.8 + (8.4 - width_per_stat * num_stats) / 2
 
+        height = 0.0
         for i, stat in enumerate(stats):
             number_el = stat.find(class_="stat-number")
             label_el = stat.find(class_="stat-label")
@@ -705,45 +1314,27 @@ class HTMLToPPTXConverter:
             number = get_text(number_el) if number_el else ""
             label = get_text(label_el) if label_el else ""
 
+            paragraphs = [
+                ParagraphSpec(number, 40, MS_CYAN, bold=True),
+                ParagraphSpec(label, 12, GRAY_70),
+            ]
             left = start_left + i * width_per_stat
+            stat_height = self._add_paragraphs(slide, paragraphs, left, top, width_per_stat, align=PP_ALIGN.CENTER)
+            height = max(height, stat_height)
 
-            # Number
-            add_text_box(
-                slide,
-                number,
-                left=left,
-                top=top,
-                width=width_per_stat,
-                height=0.6,
-                font_size=40,
-                bold=True,
-                color=MS_CYAN,
-                align=PP_ALIGN.CENTER,
-            )
-
-            # Label
-            add_text_box(
-                slide,
-                label,
-                left=left,
-                top=top + 0.6,
-                width=width_per_stat,
-                height=0.4,
-                font_size=12,
-                color=GRAY_70,
-                align=PP_ALIGN.CENTER,
-            )
+        return height
 
-    def _add_quote(self, slide, quote: Tag, top: float):
-        """Add a quote to the slide."""
-        text = get_text(quote)
+    def _add_quote(self, slide, quote: Tag, top: float) -> float:
+        """Add a quote to the slide and return its height."""
+        text = f'"{get_text(quote)}"'
+        height = text_height(text, 24, 8.4)
         add_text_box(
             slide,
-            f'"{text}"',
+            text,
             left=0.8,
             top=top,
             width=8.4,
-            height=1.2,
+            height=height,
             font_size=24,
             italic=True,
             color=WHITE,
@@ -757,13 +1348,16 @@ class HTMLToPPTXConverter:
                 slide,
                 get_text(attribution),
                 left=0.8,
-                top=top + 1.2,
+                top=top + height,
                 width=8.4,
                 height=0.3,
                 font_size=14,
                 color=GRAY_50,
                 align=PP_ALIGN.CENTER,
             )
+            height += 0.3
+
+        return height
 
     def convert(self) -> Presentation:
         """Convert the HTML to a PowerPoint presentation."""
@@ -779,37 +1373,258 @@ class HTMLToPPTXConverter:
         self.prs.save(output_path)
 
 
+@dataclass
+class ConversionResult:
+    """Outcome of converting a single deck."""
+
+    input_path: Path
+    output_path: Path
+    ok: bool
+    slides: int = 0
+    seconds: float = 0.0
+    error: str = ""
+
+
+def convert_file(input_path: Path, output_path: Path, **converter_options) -> ConversionResult:
+    """Convert one HTML deck to PPTX, capturing failures instead of raising.
+
+    converter_options are passed through to HTMLToPPTXConverter (engine, text_mode).
+    """
+    start = time.perf_counter()
+    try:
+        html_content = input_path.read_text(encoding="utf-8")
+        converter = HTMLToPPTXConverter(html_content, **converter_options)
+        prs = converter.convert()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        converter.save(str(output_path))
+        return ConversionResult(
+            input_path, output_path, True, slides=len(prs.slides), seconds=time.perf_counter() - start
+        )
+    except Exception as e:
+        return ConversionResult(
+            input_path, output_path, False, seconds=time.perf_counter() - start, error=f"{type(e).__name__}: {e}"
+        )
+
+
+def _convert_job(job: tuple[Path, Path], **converter_options) -> ConversionResult:
+    """Process-pool entry point (must be importable at module level)."""
+    return convert_file(*job, **converter_options)
+
+
+def resolve_inputs(patterns: list[str]) -> list[Path]:
+    """Expand files, directories (*.html, non-recursive) and glob patterns into a sorted, de-duplicated list."""
+    found: dict[Path, None] = {}
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(path.glob("*.html"))
+        elif path.exists():
+            matches = [path]
+        else:
+            matches = sorted(Path(m) for m in glob.glob(pattern, recursive=True) if m.endswith(".html"))
+            if not matches:
+                print(f"Warning: No HTML files match: {pattern}", file=sys.stderr)
+        for match in matches:
+            found.setdefault(match, None)
+    return list(found)
+
+
+def plan_outputs(inputs: list[Path], output_dir: Optional[Path]) -> list[tuple[Path, Path]]:
+    """Pair each input with its output path; alongside the input unless output_dir is given."""
+    jobs = []
+    seen: dict[Path, Path] = {}
+    for input_path in inputs:
+        if output_dir:
+            output_path = output_dir / input_path.with_suffix(".pptx").name
+        else:
+            output_path = input_path.with_suffix(".pptx")
+        if output_path in seen:
+            raise ValueError(f"{input_path} and {seen[output_path]} would both write {output_path}")
+        seen[output_path] = input_path
+        jobs.append((input_path, output_path))
+    return jobs
+
+
+def hash_file(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class BuildManifest:
+    """Persistent record of converted decks, used to skip unchanged inputs.
+
+    Entries are keyed by output path and store the input's content hash, the
+    converter version and text mode that produced the output, and the output
+    size so a deleted or replaced .pptx is rebuilt.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                self.entries = data.get("entries", {})
+            except (OSError, ValueError) as e:
+                print(f"Warning: Ignoring unreadable manifest {path}: {e}", file=sys.stderr)
+
+    def is_up_to_date(self, input_hash: str, output_path: Path, text_mode: str = DEFAULT_TEXT_MODE) -> bool:
+        """Check whether output_path was built from this exact input by this converter version and mode."""
+        entry = self.entries.get(str(output_path))
+        if not entry or not output_path.exists():
+            return False
+        return (
+            entry.get("sha256") == input_hash
+            and entry.get("converter_version") == CONVERTER_VERSION
+            and entry.get("text_mode", DEFAULT_TEXT_MODE) == text_mode
+            and entry.get("output_size") == output_path.stat().st_size
+        )
+
+    def record(self, result: ConversionResult, input_hash: str, text_mode: str = DEFAULT_TEXT_MODE):
+        """Store a successful conversion, or forget a failed one."""
+        key = str(result.output_path)
+        if not result.ok:
+            self.entries.pop(key, None)
+            return
+        self.entries[key] = {
+            "input": str(result.input_path),
+            "sha256": input_hash,
+            "converter_version": CONVERTER_VERSION,
+            "text_mode": text_mode,
+            "output_size": result.output_path.stat().st_size,
+        }
+
+    def save(self):
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"converter_version": CONVERTER_VERSION, "entries": self.entries}, indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
+
+
+def convert_batch(jobs: list[tuple[Path, Path]], workers: Optional[int] = None, **converter_options):
+    """Convert many decks, fanning out across a process pool.
+
+    Yields a ConversionResult per deck as each one finishes. With a single
+    job or worker the conversion runs in-process to skip pool start-up.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        for job in jobs:
+            yield convert_file(*job, **converter_options)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_convert_job, job, **converter_options) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Convert Amplifier Stories HTML decks to PowerPoint presentations."
     )
-    parser.add_argument("input", help="Input HTML file path")
-    parser.add_argument("output", nargs="?", help="Output PPTX file path (default: same name as input)")
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        metavar="input",
+        help="Input HTML file, directory or glob pattern (a trailing .pptx path names the output for a single input)",
+    )
+    parser.add_argument("-o", "--output-dir", help="Directory for generated PPTX files (default: next to each input)")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None, help="Worker processes for batch mode (default: CPU count)"
+    )
+    parser.add_argument(
+        "--manifest",
+        help=f"Build manifest for incremental batch rebuilds (default: {MANIFEST_NAME} in the output dir or cwd)",
+    )
+    parser.add_argument("--force", action="store_true", help="Rebuild every deck, ignoring the build manifest")
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default=DEFAULT_ENGINE,
+        help=f"HTML parse engine: streaming lxml or full-tree BeautifulSoup (default: {DEFAULT_ENGINE})",
+    )
+    parser.add_argument(
+        "--text-mode",
+        choices=TEXT_MODES,
+        default=DEFAULT_TEXT_MODE,
+        help="Emit lists, versus columns and stats as one text frame each (merged) or one box per item (boxes)",
+    )
 
     args = parser.parse_args()
-
-    input_path = Path(args.input)
-    if not input_path.exists():
-        print(f"Error: Input file not found: {input_path}", file=sys.stderr)
-        sys.exit(1)
-
-    if args.output:
-        output_path = Path(args.output)
+    converter_options = {"engine": args.engine, "text_mode": args.text_mode}
+
+    # Legacy form: html2pptx.py <input.html> <output.pptx>; a lone file is converted the same way.
+    # Directories, globs and several inputs always go through the manifest, even if they match one deck.
+    legacy = len(args.inputs) == 2 and args.inputs[1].lower().endswith(".pptx")
+    single_file = legacy or (len(args.inputs) == 1 and Path(args.inputs[0]).is_file())
+    if legacy:
+        input_path = Path(args.inputs[0])
+        if not input_path.exists():
+            print(f"Error: Input file not found: {input_path}", file=sys.stderr)
+            sys.exit(1)
+        jobs = [(input_path, Path(args.inputs[1]))]
     else:
-        output_path = input_path.with_suffix(".pptx")
-
-    print(f"Converting: {input_path}")
-    print(f"Output: {output_path}")
-
-    # Read HTML content
-    html_content = input_path.read_text(encoding="utf-8")
-
-    # Convert
-    converter = HTMLToPPTXConverter(html_content)
-    converter.convert()
-    converter.save(str(output_path))
+        inputs = resolve_inputs(args.inputs)
+        if not inputs:
+            print("Error: No input HTML files found", file=sys.stderr)
+            sys.exit(1)
+        try:
+            jobs = plan_outputs(inputs, Path(args.output_dir) if args.output_dir else None)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    if single_file:
+        input_path, output_path = jobs[0]
+        print(f"Converting: {input_path}")
+        print(f"Output: {output_path}")
+        result = convert_file(input_path, output_path, **converter_options)
+        if not result.ok:
+            print(f"Error: {result.error}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Done! Created {output_path}")
+        return
+
+    if args.manifest:
+        manifest_path = Path(args.manifest)
+    else:
+        manifest_path = (Path(args.output_dir) if args.output_dir else Path.cwd()) / MANIFEST_NAME
+    manifest = BuildManifest(manifest_path)
+
+    input_hashes = {}
+    pending = []
+    skipped = 0
+    for input_path, output_path in jobs:
+        try:
+            input_hashes[input_path] = hash_file(input_path)
+        except OSError:
+            input_hashes[input_path] = ""
+        if not args.force and manifest.is_up_to_date(input_hashes[input_path], output_path, args.text_mode):
+            skipped += 1
+            continue
+        pending.append((input_path, output_path))
+
+    print(f"Converting {len(pending)} of {len(jobs)} decks ({skipped} up to date)...")
+    start = time.perf_counter()
+    failed = 0
+    for result in convert_batch(pending, args.jobs, **converter_options):
+        manifest.record(result, input_hashes[result.input_path], args.text_mode)
+        if result.ok:
+            print(f"  ✓ {result.input_path} -> {result.output_path} ({result.slides} slides, {result.seconds:.2f}s)")
+        else:
+            failed += 1
+            print(f"  ✗ {result.input_path}: {result.error}", file=sys.stderr)
+    manifest.save()
 
-    print(f"Done! Created {output_path}")
+    elapsed = time.perf_counter() - start
+    print(f"Done! {len(pending) - failed} converted, {skipped} skipped, {failed} failed in {elapsed:.1f}s")
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+html2pptx_server.py - Keep html2pptx warm and convert decks over a local socket.
+
+Starting `uv run --with python-pptx,beautifulsoup4,lxml python tools/html2pptx.py`
+per deck pays environment resolution plus the BeautifulSoup/lxml/python-pptx
+imports every time. This module runs a long-lived server that has already paid
+those costs (and preloaded the DeckTheme), plus a tiny client that imports
+nothing but the standard library.
+
+Usage:
+    # Start the server (foreground; Ctrl-C or `stop` to exit)
+    uv run --with python-pptx,beautifulsoup4,lxml python tools/html2pptx_server.py serve
+
+    # Convert through the running server
+    python tools/html2pptx_server.py convert docs/my-deck.html [output.pptx]
+
+    # Check / stop the server
+    python tools/html2pptx_server.py ping
+    python tools/html2pptx_server.py stop
+
+Protocol: one JSON object per line over a Unix socket. Requests are {"op":
+"convert", "input": ..., "output": ..., "options": {...}}, {"op": "ping"} or
+{"op": "shutdown"}; every request gets a single JSON line back with at least an
+"ok" field.
+
+Requests are unauthenticated and name arbitrary input and output paths, so the
+socket is only ever created owner-only (umask 0o177); there is deliberately no
+TCP mode. Where Unix sockets are unavailable, `convert` converts in-process.
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_SOCKET = Path(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()) / (
+    f"html2pptx-{os.getuid()}.sock" if hasattr(os, "getuid") else "html2pptx.sock"
+)
+
+
+class ConversionHandler(socketserver.StreamRequestHandler):
+    """Handle newline-delimited JSON requests on one connection."""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                response = self.server.dispatch(request)
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if response.get("shutting_down"):
+                return
+
+
+class UnixConversionServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Owner-only Unix socket server that dispatches conversion requests."""
+
+    daemon_threads = True
+
+    def dispatch(self, request: dict) -> dict:
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid(), "uptime": round(time.monotonic() - self.started, 1)}
+        if op == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True, "shutting_down": True}
+        if op == "convert":
+            from html2pptx import convert_file
+
+            result = convert_file(Path(request["input"]), Path(request["output"]), **request.get("options", {}))
+            return {
+                "ok": result.ok,
+                "input": str(result.input_path),
+                "output": str(result.output_path),
+                "slides": result.slides,
+                "seconds": round(result.seconds, 4),
+                "error": result.error,
+            }
+        return {"ok": False, "error": f"Unknown op: {op!r}"}
+
+
+def serve(socket_path: Path):
+    """Warm up html2pptx and serve conversion requests until shutdown."""
+    if not hasattr(socket, "AF_UNIX"):
+        print("Error: Unix sockets are not available on this platform", file=sys.stderr)
+        sys.exit(1)
+
+    # Pay the heavy imports and theme construction once, up front
+    from html2pptx import get_theme
+
+    get_theme()
+
+    if socket_path.exists():
+        if _connect(socket_path, timeout=0.5) is not None:
+            print(f"Error: A server is already listening on {socket_path}", file=sys.stderr)
+            sys.exit(1)
+        socket_path.unlink()  # stale socket from a crashed server
+    old_umask = os.umask(0o177)  # socket readable/writable by the owner only
+    try:
+        server = UnixConversionServer(str(socket_path), ConversionHandler)
+    finally:
+        os.umask(old_umask)
+
+    server.started = time.monotonic()
+    print(f"html2pptx server listening on {socket_path} (pid {os.getpid()})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path.exists():
+            socket_path.unlink()
+    print("html2pptx server stopped")
+
+
+def _connect(socket_path: Path, timeout: float | None = None) -> socket.socket | None:
+    """Open a connection to the server, or return None if nothing is listening."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        return sock
+    except OSError:
+        return None
+
+
+def request(socket_path: Path, payload: dict) -> dict | None:
+    """Send one request and return the response, or None if no server is running."""
+    sock = _connect(socket_path)
+    if sock is None:
+        return None
+    with sock, sock.makefile("rwb") as stream:
+        stream.write(json.dumps(payload).encode("utf-8") + b"\n")
+        stream.flush()
+        line = stream.readline()
+    return json.loads(line) if line else {"ok": False, "error": "Server closed the connection"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm html2pptx conversion server and client.")
+    parser.add_argument("--socket", default=str(DEFAULT_SOCKET), help=f"Unix socket path (default: {DEFAULT_SOCKET})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("serve", help="Run the conversion server in the foreground")
+    commands.add_parser("ping", help="Check whether a server is running")
+    commands.add_parser("stop", help="Ask the running server to shut down")
+    convert = commands.add_parser("convert", help="Convert a deck through the running server")
+    convert.add_argument("input", help="Input HTML file path")
+    convert.add_argument("output", nargs="?", help="Output PPTX file path (default: same name as input)")
+    convert.add_argument("--text-mode", help="Passed through to HTMLToPPTXConverter")
+    convert.add_argument("--engine", help="Passed through to HTMLToPPTXConverter")
+    convert.add_argument(
+        "--no-fallback", action="store_true", help="Fail instead of converting in-process when no server is running"
+    )
+
+    args = parser.parse_args()
+    socket_path = Path(args.socket)
+
+    if args.command == "serve":
+        serve(socket_path)
+        return
+
+    if args.command in ("ping", "stop"):
+        response = request(socket_path, {"op": "ping" if args.command == "ping" else "shutdown"})
+        if response is None:
+            print("No html2pptx server running", file=sys.stderr)
+            sys.exit(1)
+        if args.command == "ping":
+            print(f"html2pptx server running (pid {response['pid']}, up {response['uptime']}s)")
+        else:
+            print("html2pptx server stopping")
+        return
+
+    input_path = Path(args.input).resolve()
+    if not input_path.exists():
+        print(f"Error: Input file not found: {input_path}", file=sys.stderr)
+        sys.exit(1)
+    output_path = Path(args.output).resolve() if args.output else input_path.with_suffix(".pptx")
+    options = {key: value for key, value in (("text_mode", args.text_mode), ("engine", args.engine)) if value}
+
+    payload = {"op": "convert", "input": str(input_path), "output": str(output_path), "options": options}
+    response = request(socket_path, payload)
+    if response is None:
+        if args.no_fallback:
+            print("Error: No html2pptx server running", file=sys.stderr)
+            sys.exit(1)
+        print("No html2pptx server running; converting in-process", file=sys.stderr)
+        from html2pptx import convert_file
+
+        result = convert_file(input_path, output_path, **options)
+        response = {"ok": result.ok, "slides": result.slides, "seconds": result.seconds, "error": result.error}
+
+    if not response["ok"]:
+        print(f"Error: {response['error']}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Done! Created {output_path} ({response['slides']} slides, {response['seconds']:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+session_pipeline.py - Analyze Amplifier sessions and build the Excel dashboard in one pass.
+
+Running analyze_sessions.py and then create_dashboard.py writes every result to
+JSON and CSV, only for the dashboard to re-read the CSV and re-split its
+", "-joined columns. This pipeline keeps one compact SessionRecord per session
+in memory instead: each analysis result is folded into the summary statistics
+and converted to a record as it arrives, and the dashboard (plus any exports
+asked for) is produced from those records. No intermediate files are written
+unless --json, --csv or --columnar is given.
+
+Takes the same session selection options as analyze_sessions.py (--days,
+--since/--until, --project, --bundle, --model, -j, --cache, ...).
+
+Usage:
+    uv run --with openpyxl,pandas python tools/session_pipeline.py --days 30 [-o dashboard.xlsx]
+    uv run --with openpyxl,pandas python tools/session_pipeline.py --days 7 --csv sessions.csv --json sessions.json
+"""
+
+import argparse
+
+from analyze_sessions import (
+    SessionRecord,
+    add_analysis_arguments,
+    analyze_from_args,
+    analyzer_from_args,
+    check_columnar_output,
+    print_summary,
+)
+from create_dashboard import DEFAULT_OUTPUT, DashboardData, build_dashboard
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze Amplifier sessions and build the dashboard in one pass.")
+    add_analysis_arguments(parser)
+    parser.add_argument("-o", "--output", default=str(DEFAULT_OUTPUT), help="Dashboard XLSX (default: in ~/Downloads)")
+    parser.add_argument("--json", metavar="PATH", help="Also export full results and summary statistics as JSON")
+    parser.add_argument("--csv", metavar="PATH", help="Also export one row per session as CSV")
+    parser.add_argument(
+        "--columnar",
+        metavar="PATH",
+        help="Also export typed sessions and <stem>_tool_usage tables (.parquet, or .arrow/.feather; needs pyarrow)",
+    )
+    args = parser.parse_args()
+    if args.columnar:
+        # Fail now rather than after the analysis and the other exports
+        try:
+            check_columnar_output(args.columnar)
+        except (ValueError, ImportError) as e:
+            parser.error(str(e))
+    analyzer, session_filter = analyzer_from_args(args)
+
+    # The JSON and columnar exports need the nested per-pattern results; otherwise only records are kept
+    keep_results = bool(args.json or args.columnar)
+    sessions = analyze_from_args(
+        analyzer, session_filter, args, as_record=None if keep_results else SessionRecord.from_result
+    )
+    if not sessions:
+        print("No sessions matched; nothing to build.")
+        return
+    records = [SessionRecord.from_result(s) for s in sessions] if keep_results else sessions
+    summary = analyzer.last_run_summary.result()
+
+    if args.json:
+        analyzer.export_to_json(sessions, summary, args.json)
+    if args.csv:
+        analyzer.export_to_csv(records, args.csv)
+    if args.columnar:
+        analyzer.export_to_columnar(sessions, args.columnar)
+    del sessions  # only the records are needed from here on
+
+    data = DashboardData.from_sessions(records)
+    output_path = build_dashboard(data, args.output)
+    print(f"✅ Dashboard created: {output_path}")
+    print(f"📈 {data.approaches.nunique()} unique approaches identified")
+
+    print_summary(summary)
+    print("✨ Pipeline complete!")
+
+
+if __name__ == "__main__":
+    main()